@@ -0,0 +1,103 @@
+"""
+Shared readers for the simulator outputs (event_atlas.csv / domain_atlas.csv)
+used by the analysis and plotting scripts.
+
+The atlases are written once and re-read by every script, so reads are
+column-projected and dtype-pinned. When pyarrow is installed, the Parquet
+sidecar written by the simulator (e.g. event_atlas.parquet) is preferred over
+the CSV, and CSVs are parsed with pyarrow's multithreaded reader; otherwise
+pandas' C parser is used. JSON outputs are parsed with orjson when available.
+
+`is_stale` lets the plot scripts skip re-rendering figures whose inputs have
+not changed since the last run.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+import pandas as pd
+
+try:
+	import pyarrow  # noqa: F401
+	HAVE_PYARROW = True
+except ImportError:
+	HAVE_PYARROW = False
+
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
+CSV_ENGINE = "pyarrow" if HAVE_PYARROW else "c"
+
+# Atlas columns are physical quantities with well under 7 significant digits,
+# so floats are read as float32 and ids/actions as narrow ints.
+ATLAS_DTYPES: Dict[str, str] = {
+	# shared
+	"t": "float32",
+	"action": "int8",
+	# event_atlas.csv
+	"mean_V": "float32",
+	"LOW_occ": "float32",
+	"mismatch": "float32",
+	"E": "float32",
+	"PLV": "float32",
+	"global_v_offset": "float32",
+	"domain_low_fraction": "float32",
+	"redox_bit": "float32",
+	"D_est": "float32",
+	# domain_atlas.csv
+	"domain_id": "int16",
+	"mean_V_dom": "float32",
+	"LOW_occ_dom": "float32",
+	"mismatch_dom": "float32",
+	"E_dom": "float32",
+	"domain_low_fraction_dom": "float32",
+	"controller_health": "float32",
+}
+
+
+def read_atlas(
+	path: Path,
+	usecols: Sequence[str],
+	dtype: Optional[Dict[str, str]] = None,
+	na_values: Optional[Sequence[str]] = None,
+	engine: Optional[str] = None,
+) -> pd.DataFrame:
+	"""
+	Read only `usecols` from an atlas. Columns are pinned to ATLAS_DTYPES;
+	`dtype` overrides individual entries. Uses the Parquet sidecar of `path`
+	if present and not older than the CSV, unless `engine` names a CSV parser
+	explicitly (e.g. "c" to parse exactly as a plain pd.read_csv would).
+	"""
+	dtype = {c: ATLAS_DTYPES[c] for c in usecols if c in ATLAS_DTYPES} | dict(dtype or {})
+	path = Path(path)
+	parquet = path.with_suffix(".parquet")
+	if engine is None and HAVE_PYARROW and parquet.exists() and (
+		not path.exists() or parquet.stat().st_mtime >= path.stat().st_mtime
+	):
+		df = pd.read_parquet(parquet, columns=list(usecols))
+		return df.astype(dtype) if dtype else df
+	return pd.read_csv(
+		path,
+		engine=engine or CSV_ENGINE,
+		usecols=list(usecols),
+		dtype=dtype,
+		na_values=None if na_values is None else list(na_values),
+	)
+
+
+def is_stale(out: Path, *deps: Path) -> bool:
+	"""True if `out` is missing or older than any of the existing `deps`."""
+	out = Path(out)
+	if not out.exists():
+		return True
+	mtime = out.stat().st_mtime
+	return any(Path(d).stat().st_mtime > mtime for d in deps if Path(d).exists())
+
+
+def load_json(path: Path) -> Any:
+	"""Parse a JSON output (summary.json, roc_pr.json); orjson if installed."""
+	data = Path(path).read_bytes()
+	return orjson.loads(data) if orjson is not None else json.loads(data)
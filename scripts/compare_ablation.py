@@ -1,24 +1,26 @@
+import argparse
 from pathlib import Path
-import json
-import sys
 
 import matplotlib.pyplot as plt
 import pandas as pd
 
+from atlas_io import is_stale, load_json, read_atlas
+
 
 def load(run_dir: Path):
-	s = json.loads((run_dir / "summary.json").read_text())
-	ev = pd.read_csv(run_dir / "event_atlas.csv")
+	s = load_json(run_dir / "summary.json")
+	ev = read_atlas(run_dir / "event_atlas.csv", usecols=["t", "mean_V"])
 	return s, ev
 
 
 def main() -> None:
-	if len(sys.argv) != 3:
-		print("Usage: python scripts/compare_ablation.py RUN_ON_DIR RUN_OFF_DIR")
-		raise SystemExit(1)
+	ap = argparse.ArgumentParser()
+	ap.add_argument("run_on_dir", type=Path)
+	ap.add_argument("run_off_dir", type=Path)
+	ap.add_argument("--force", action="store_true", help="re-render the figure even if it is up to date")
+	args = ap.parse_args()
 
-	on_dir = Path(sys.argv[1])
-	off_dir = Path(sys.argv[2])
+	on_dir, off_dir = args.run_on_dir, args.run_off_dir
 	s_on, ev_on = load(on_dir)
 	s_off, ev_off = load(off_dir)
 
@@ -28,14 +30,19 @@ def main() -> None:
 	print(df.to_string())
 
 	# One “control mattered” figure: mean V over time
+	out = Path("fig_ablation_meanV.png")
+	deps = [d / name for d in (on_dir, off_dir) for name in ("event_atlas.csv", "summary.json")]
+	if not args.force and not is_stale(out, *deps, Path(__file__)):
+		print(f"{out} is up to date (use --force to re-render)")
+		return
 	plt.figure()
-	plt.plot(ev_on["t"], ev_on["mean_V"], label="controller ON")
-	plt.plot(ev_off["t"], ev_off["mean_V"], label="no actuation")
+	plt.plot(ev_on["t"].to_numpy(copy=False), ev_on["mean_V"].to_numpy(copy=False), label="controller ON")
+	plt.plot(ev_off["t"].to_numpy(copy=False), ev_off["mean_V"].to_numpy(copy=False), label="no actuation")
 	plt.xlabel("time (s)")
 	plt.ylabel("mean V (mV)")
 	plt.legend()
 	plt.tight_layout()
-	plt.savefig("fig_ablation_meanV.png", dpi=200)
+	plt.savefig(out, dpi=200)
 
 
 if __name__ == "__main__":
@@ -21,18 +21,36 @@ import json
 from pathlib import Path
 
 import numpy as np
-import pandas as pd
 
+from atlas_io import read_atlas
 
-def compute_roc_pr(scores: np.ndarray, labels: np.ndarray):
+
+def _with_endpoints(x: np.ndarray, first: float, last: float) -> np.ndarray:
+	"""Return [first, *x, last] in a single preallocated buffer."""
+	out = np.empty(x.shape[0] + 2, dtype=float)
+	out[0] = first
+	out[1:-1] = x
+	out[-1] = last
+	return out
+
+
+def _auc(x: np.ndarray, y: np.ndarray) -> float:
+	"""Trapezoidal area under y(x); avoids np.trapz (deprecated in NumPy 2)."""
+	return float(np.sum(np.diff(x) * 0.5 * (y[1:] + y[:-1])))
+
+
+def roc_pr_arrays(scores: np.ndarray, labels: np.ndarray):
 	"""
 	Compute ROC and PR curves and AUCs from scores and binary labels.
 
 	scores: shape (N,), higher means more likely positive
 	labels: shape (N,), 0 or 1
+
+	Returns (fpr, tpr, recall, precision, auc_roc, auc_pr); the curves are
+	arrays including their endpoints.
 	"""
 	scores = np.asarray(scores, dtype=float)
-	labels = np.asarray(labels, dtype=int)
+	labels = np.asarray(labels, dtype=np.int32)
 
 	if scores.shape != labels.shape:
 		raise ValueError("scores and labels must have the same shape")
@@ -49,8 +67,9 @@ def compute_roc_pr(scores: np.ndarray, labels: np.ndarray):
 	labels_sorted = labels[order]
 
 	# Cumulative TP / FP as we sweep threshold from +inf -> -inf
+	# (every swept sample is either a TP or an FP, so FP = rank - TP)
 	tps = np.cumsum(labels_sorted)
-	fps = np.cumsum(1 - labels_sorted)
+	fps = np.arange(1, N + 1, dtype=tps.dtype) - tps
 
 	# Avoid division by zero
 	P_safe = P if P > 0 else 1
@@ -60,34 +79,45 @@ def compute_roc_pr(scores: np.ndarray, labels: np.ndarray):
 	fpr = fps / N_safe
 
 	# Add (0,0) and (1,1) endpoints for ROC
-	fpr_points = np.concatenate([[0.0], fpr, [1.0]])
-	tpr_points = np.concatenate([[0.0], tpr, [1.0]])
+	fpr_points = _with_endpoints(fpr, 0.0, 1.0)
+	tpr_points = _with_endpoints(tpr, 0.0, 1.0)
 
-	auc_roc = float(np.trapz(tpr_points, fpr_points))
+	auc_roc = _auc(fpr_points, tpr_points)
 
 	# Precision-Recall curve
 	precision = tps / np.maximum(tps + fps, 1)
 	recall = tpr
 
 	# Add endpoints: recall=0 → precision=1 (convention), recall=1 → last precision
-	if precision.size == 0:
-		precision_points = np.array([1.0, 0.0])
-		recall_points = np.array([0.0, 1.0])
-	else:
-		precision_points = np.concatenate([[1.0], precision, [precision[-1]]])
-		recall_points = np.concatenate([[0.0], recall, [1.0]])
+	# (N > 0 is checked above, so precision is never empty)
+	precision_points = _with_endpoints(precision, 1.0, precision[-1])
+	recall_points = _with_endpoints(recall, 0.0, 1.0)
+
+	auc_pr = _auc(recall_points, precision_points)
+
+	return fpr_points, tpr_points, recall_points, precision_points, auc_roc, auc_pr
 
-	auc_pr = float(np.trapz(precision_points, recall_points))
 
+def curve_points(fpr, tpr, recall, precision):
+	"""Convert curve arrays to the JSON point lists (roc, pr)."""
 	roc = [
 		{"fpr": float(x), "tpr": float(y)}
-		for x, y in zip(fpr_points, tpr_points)
+		for x, y in zip(fpr, tpr)
 	]
 	pr = [
 		{"recall": float(x), "precision": float(y)}
-		for x, y in zip(recall_points, precision_points)
+		for x, y in zip(recall, precision)
 	]
+	return roc, pr
 
+
+def compute_roc_pr(scores: np.ndarray, labels: np.ndarray):
+	"""
+	Compute ROC and PR curves and AUCs from scores and binary labels.
+	Returns (roc, pr, auc_roc, auc_pr) with the curves as lists of point dicts.
+	"""
+	fpr, tpr, recall, precision, auc_roc, auc_pr = roc_pr_arrays(scores, labels)
+	roc, pr = curve_points(fpr, tpr, recall, precision)
 	return roc, pr, auc_roc, auc_pr
 
 
@@ -101,7 +131,15 @@ def main():
 	                    help="Window [t_max - late_window, t_max] over which to compute detection scores")
 	args = parser.parse_args()
 
-	df = pd.read_csv(args.domain_atlas)
+	# Scores and labels are published results: keep full precision here rather
+	# than the float32 atlas default used by the plotting scripts, and parse
+	# the CSV with pandas' C parser so values match a plain pd.read_csv
+	df = read_atlas(
+		args.domain_atlas,
+		usecols=["t", "domain_id", "LOW_occ_dom"],
+		dtype={"t": "float64", "LOW_occ_dom": "float64"},
+		engine="c",
+	)
 	out_dir = Path(args.out)
 	out_dir.mkdir(parents=True, exist_ok=True)
 
@@ -111,30 +149,49 @@ def main():
 	t_max = float(df["t"].max())
 	late_start = max(0.0, t_max - float(args.late_window))
 
-	domain_ids = sorted(df["domain_id"].unique().tolist())
-
-	scores = []
-	labels = []
-
-	for dom_id in domain_ids:
-		d = df[df["domain_id"] == dom_id]
-
-		# Ground truth: chronic if mean LOW occupancy over entire run >= gt_threshold
-		mean_low_full = float(d["LOW_occ_dom"].mean())
-		labels.append(1 if mean_low_full >= args.gt_threshold else 0)
-
-		# Detection score: mean LOW occupancy over last late_window seconds
-		d_late = d[d["t"] >= late_start]
-		if len(d_late) == 0:
-			mean_low_late = mean_low_full
-		else:
-			mean_low_late = float(d_late["LOW_occ_dom"].mean())
-		scores.append(mean_low_late)
-
-	scores = np.asarray(scores, dtype=float)
-	labels = np.asarray(labels, dtype=int)
-
-	roc, pr, auc_roc, auc_pr = compute_roc_pr(scores, labels)
+	# Domain ids are small non-negative integers (0..n_domains-1 from run.py).
+	# A stable sort makes each domain's rows one contiguous run in file order,
+	# so every domain mean is a single NumPy sum over a slice -- the same
+	# summation as the per-domain Series.mean(), without a hashed groupby.
+	dom = df["domain_id"].to_numpy(np.int32)
+	if dom.size and dom.min() < 0:
+		raise ValueError("domain_id must be non-negative")
+	low = df["LOW_occ_dom"].to_numpy(np.float64)
+	late_mask = df["t"].to_numpy(copy=False) >= late_start
+
+	order = np.argsort(dom, kind="stable")
+	dom_s, low_s, late_s = dom[order], low[order], late_mask[order]
+	starts = np.flatnonzero(np.concatenate(([True], dom_s[1:] != dom_s[:-1]))) if dom.size else np.zeros(0, dtype=int)
+	ends = np.append(starts[1:], dom_s.size)
+
+	# Ground truth: chronic if mean LOW occupancy over entire run >= gt_threshold
+	# Detection score: mean LOW occupancy over last late_window seconds
+	# (domains with no late samples fall back to their full-run mean)
+	full_mean = np.empty(starts.size)
+	late_mean = np.empty(starts.size)
+	for k, (a, b) in enumerate(zip(starts, ends)):
+		full_mean[k] = low_s[a:b].sum() / (b - a)
+		late = low_s[a:b][late_s[a:b]]
+		late_mean[k] = late.sum() / late.size if late.size else full_mean[k]
+
+	labels = (full_mean >= args.gt_threshold).astype(int)
+	scores = late_mean.astype(float)
+
+	fpr, tpr, recall, precision, auc_roc, auc_pr = roc_pr_arrays(scores, labels)
+	roc, pr = curve_points(fpr, tpr, recall, precision)
+
+	# Array form for the plotting script (JSON is kept for human inspection)
+	np.savez(
+		out_dir / "roc_pr.npz",
+		fpr=fpr,
+		tpr=tpr,
+		precision=precision,
+		recall=recall,
+		scores=scores,
+		labels=labels,
+		auc_roc=auc_roc,
+		auc_pr=auc_pr,
+	)
 
 	out_path = out_dir / "roc_pr.json"
 	with open(out_path, "w", encoding="utf-8") as f:
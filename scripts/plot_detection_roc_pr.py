@@ -1,30 +1,47 @@
-import json
+import argparse
 from pathlib import Path
 
 import matplotlib.pyplot as plt
 import numpy as np
 
+from atlas_io import is_stale, load_json
+
 
 def main() -> None:
+	ap = argparse.ArgumentParser()
+	ap.add_argument("--force", action="store_true", help="re-render even if the figures are up to date")
+	args = ap.parse_args()
+
 	base = Path("results/exp_baseline")
-	with open(base / "roc_pr.json", "r", encoding="utf-8") as f:
-		data = json.load(f)
+	npz_path = base / "roc_pr.npz"
+	outs = [base / f"fig_detection_{name}.png" for name in ("roc", "pr", "scores")]
+	deps = (npz_path, base / "roc_pr.json", Path(__file__))
+	if not args.force and not any(is_stale(out, *deps) for out in outs):
+		print("ROC/PR + score bar figures are up to date (use --force to re-render)")
+		return
 
-	scores = np.array(data["scores"])
-	labels = np.array(data["labels"])
-	roc = data["roc"]
-	pr = data["pr"]
-	auc_roc = data["auc_roc"]
-	auc_pr = data["auc_pr"]
+	if npz_path.exists():
+		with np.load(npz_path) as d:
+			scores, labels = d["scores"], d["labels"]
+			fpr, tpr = d["fpr"], d["tpr"]
+			recall, precision = d["recall"], d["precision"]
+			auc_roc, auc_pr = float(d["auc_roc"]), float(d["auc_pr"])
+	else:
+		# Older outputs: JSON only
+		data = load_json(base / "roc_pr.json")
+		scores = np.array(data["scores"])
+		labels = np.array(data["labels"])
+		fpr = np.array([p["fpr"] for p in data["roc"]])
+		tpr = np.array([p["tpr"] for p in data["roc"]])
+		recall = np.array([p["recall"] for p in data["pr"]])
+		precision = np.array([p["precision"] for p in data["pr"]])
+		auc_roc = data["auc_roc"]
+		auc_pr = data["auc_pr"]
 
 	# 1) ROC curve
 	fig, ax = plt.subplots(figsize=(4, 4))
 	ax.plot([0, 1], [0, 1], linestyle="--")
-	ax.plot(
-		[p["fpr"] for p in roc],
-		[p["tpr"] for p in roc],
-		marker="o",
-	)
+	ax.plot(fpr, tpr, marker="o")
 	ax.set_xlabel("False positive rate")
 	ax.set_ylabel("True positive rate")
 	ax.set_title(f"ROC (AUC = {auc_roc:.2f})")
@@ -34,11 +51,7 @@ def main() -> None:
 
 	# 2) PR curve
 	fig, ax = plt.subplots(figsize=(4, 4))
-	ax.plot(
-		[p["recall"] for p in pr],
-		[p["precision"] for p in pr],
-		marker="o",
-	)
+	ax.plot(recall, precision, marker="o")
 	ax.set_xlabel("Recall")
 	ax.set_ylabel("Precision")
 	ax.set_title(f"PR (AUC = {auc_pr:.2f})")
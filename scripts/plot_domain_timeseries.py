@@ -1,51 +1,80 @@
+import argparse
 from pathlib import Path
 
 import matplotlib.pyplot as plt
-import pandas as pd
+import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+
+from atlas_io import is_stale, read_atlas
+
+# (column, legend label, color, linestyle) for the LOW-metrics panel
+LOW_TRACES = [
+	("LOW_occ_dom", "LOW_occ_dom", "C0", "-"),
+	("domain_low_fraction_dom", "domain_low_frac_dom", "C1", "--"),
+]
 
 
 def plot_domain(ax_row, dom_df, label_prefix: str) -> None:
-	t = dom_df["t"].values
+	t = dom_df["t"].to_numpy(copy=False)
 
 	# Top: V
 	ax_V, ax_low = ax_row
 
-	ax_V.plot(t, dom_df["mean_V_dom"])
+	ax_V.plot(t, dom_df["mean_V_dom"].to_numpy(copy=False))
 	ax_V.axhline(-60.0, linestyle=":", linewidth=1)
 	ax_V.set_ylabel(f"{label_prefix}\nV_dom (mV)")
 
-	# Bottom: LOW occupancy & LOW fraction
-	ax_low.plot(t, dom_df["LOW_occ_dom"], label="LOW_occ_dom")
-	ax_low.plot(
-		t,
-		dom_df["domain_low_fraction_dom"],
-		linestyle="--",
-		label="domain_low_frac_dom",
-	)
+	# Bottom: LOW occupancy & LOW fraction, batched into one collection with
+	# fixed limits so matplotlib does not autoscale over the segments
+	segments = [np.column_stack([t, dom_df[col].to_numpy(copy=False)]) for col, *_ in LOW_TRACES]
+	ax_low.add_collection(LineCollection(
+		segments,
+		colors=[c for *_, c, _ in LOW_TRACES],
+		linestyles=[ls for *_, ls in LOW_TRACES],
+	))
 	ax_low.set_ylabel(f"{label_prefix}\nLOW metrics")
 	ax_low.set_ylim(-0.05, 1.05)
 	# Optionally zoom early time to make LOW decay clearer
 	ax_low.set_xlim(0, 50)
 
 
+def low_legend_handles():
+	"""Proxy artists for the LOW-metrics collection (collections have no per-line labels)."""
+	return [Line2D([], [], color=c, linestyle=ls, label=label) for _, label, c, ls in LOW_TRACES]
+
+
 def main() -> None:
+	ap = argparse.ArgumentParser()
+	ap.add_argument("--force", action="store_true", help="re-render even if the figure is up to date")
+	args = ap.parse_args()
+
 	base = Path("results/exp_baseline")
-	df = pd.read_csv(base / "domain_atlas.csv")
+	out = base / "fig_domain_timeseries.png"
+	if not args.force and not is_stale(out, base / "domain_atlas.csv", Path(__file__)):
+		print(f"{out} is up to date (use --force to re-render)")
+		return
+
+	df = read_atlas(
+		base / "domain_atlas.csv",
+		usecols=["t", "domain_id", "mean_V_dom", "LOW_occ_dom", "domain_low_fraction_dom"],
+	)
 
 	fig, axes = plt.subplots(
 		nrows=4, ncols=2, sharex=False, figsize=(8, 9)
 	)
 
+	# Partition once instead of re-scanning the frame for every domain
+	groups = dict(iter(df.groupby("domain_id", sort=True)))
 	for dom_id, (row_V, row_low) in enumerate(axes):
-		dom_df = df[df["domain_id"] == dom_id]
+		dom_df = groups.get(dom_id, df.iloc[:0])
 		label = f"domain {dom_id}"
 		plot_domain((row_V, row_low), dom_df, label_prefix=label)
 
 	axes[-1][1].set_xlabel("time (s)")
-	axes[-1][1].legend(loc="upper right", fontsize=7)
+	axes[-1][1].legend(handles=low_legend_handles(), loc="upper right", fontsize=7)
 
 	fig.tight_layout()
-	out = base / "fig_domain_timeseries.png"
 	fig.savefig(out, dpi=300)
 	print(f"Saved {out}")
 
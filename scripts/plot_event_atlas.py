@@ -1,38 +1,52 @@
-import json
+import argparse
 from pathlib import Path
 
 import matplotlib.pyplot as plt
-import pandas as pd
+
+from atlas_io import is_stale, load_json, read_atlas
 
 
 def main() -> None:
+	ap = argparse.ArgumentParser()
+	ap.add_argument("--force", action="store_true", help="re-render even if the figure is up to date")
+	args = ap.parse_args()
+
 	base = Path("results/exp_baseline")
-	df = pd.read_csv(base / "event_atlas.csv")
-	with open(base / "summary.json", "r", encoding="utf-8") as f:
-		summary = json.load(f)
+	out = base / "fig_event_atlas.png"
+	deps = (base / "event_atlas.csv", base / "summary.json", Path(__file__))
+	if not args.force and not is_stale(out, *deps):
+		print(f"{out} is up to date (use --force to re-render)")
+		return
 
-	t = df["t"].values
+	df = read_atlas(
+		base / "event_atlas.csv",
+		usecols=["t", "action", "mean_V", "PLV", "domain_low_fraction"],
+		# PLV is blank until the detector has enough samples
+		na_values=["", "nan", "None", "inf", "-inf"],
+	)
+	summary = load_json(base / "summary.json")
+
+	t = df["t"].to_numpy(copy=False)
 
 	fig, axes = plt.subplots(4, 1, sharex=True, figsize=(7, 7))
 
 	# 1) Mean Vmem
-	axes[0].plot(t, df["mean_V"])
+	axes[0].plot(t, df["mean_V"].to_numpy(copy=False))
 	axes[0].set_ylabel("mean V (mV)")
 	axes[0].axhline(-60.0, linestyle=":", linewidth=1)
 	axes[0].set_title("Global dynamics (baseline controller)")
 
 	# 2) Fraction of cells in LOW band (global)
-	axes[1].plot(t, df["domain_low_fraction"])
+	axes[1].plot(t, df["domain_low_fraction"].to_numpy(copy=False))
 	axes[1].set_ylabel("LOW frac\n(global)")
 	axes[1].set_ylim(-0.05, 1.05)
 
 	# 3) PLV
-	plv = pd.to_numeric(df["PLV"], errors="coerce")
-	axes[2].plot(t, plv)
+	axes[2].plot(t, df["PLV"].to_numpy(copy=False))
 	axes[2].set_ylabel("PLV")
 
 	# 4) Max action across domains (0=REST,1=REPAIR,2=PRUNE)
-	axes[3].step(t, df["action"], where="post")
+	axes[3].step(t, df["action"].to_numpy(copy=False), where="post")
 	axes[3].set_ylabel("max action")
 	axes[3].set_xlabel("time (s)")
 
@@ -45,7 +59,6 @@ def main() -> None:
 			ax.axvline(t_rec, linestyle="--", linewidth=1)
 
 	fig.tight_layout()
-	out = base / "fig_event_atlas.png"
 	fig.savefig(out, dpi=300)
 	print(f"Saved {out}")
 
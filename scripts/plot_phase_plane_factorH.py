@@ -1,20 +1,41 @@
+import argparse
 import numpy as np
 import matplotlib.pyplot as plt
 from pathlib import Path
 
+from atlas_io import is_stale
+
 
 def tf_depol(V, V_thr: float = -20.0, sigma: float = 5.0):
 	"""Map V (mV) to a 0-1 depolarization signal."""
 	return 1.0 / (1.0 + np.exp(-(V - V_thr) / sigma))
 
 
-def hill(x, n: float, K: float = 0.5):
-	"""Hill activation with cooperativity n."""
-	x_clip = np.clip(x, 0.0, 1.0)
-	return x_clip**n / (K**n + x_clip**n)
+def hill(x, n: float, K: float = 0.5, clip: bool = True):
+	"""Hill activation with cooperativity n (pass clip=False if x is already in [0, 1])."""
+	xn = (np.clip(x, 0.0, 1.0) if clip else x) ** n
+	return xn / (K**n + xn)
+
+
+def make_grid(n_pts: int = 200):
+	"""
+	(V, H) axes, their meshgrid, and the clipped TF_depol over the plane and
+	along the V axis. None of these depend on n, so they are shared across
+	phase planes.
+	"""
+	V = np.linspace(-80, 20, n_pts)
+	H = np.linspace(0.0, 1.0, n_pts)
+	VV, HH = np.meshgrid(V, H)
+	TF = np.clip(tf_depol(VV), 0.0, 1.0)
+	TF_line = np.clip(tf_depol(V), 0.0, 1.0)
+	return V, H, VV, HH, TF, TF_line
 
 
-def phase_plane(n: float = 2.0, out_path: str | Path = "results/phase_plane_n2.png"):
+def phase_plane(
+	n: float = 2.0,
+	out_path: str | Path = "results/phase_plane_n2.png",
+	grid=None,
+):
 	# Parameters chosen to be qualitatively reasonable, not fit to data
 	EL = -60.0   # mV
 	gL = 0.05    # leak
@@ -24,19 +45,16 @@ def phase_plane(n: float = 2.0, out_path: str | Path = "results/phase_plane_n2.p
 	k_deg = 0.1
 
 	# Grid
-	V = np.linspace(-80, 20, 200)
-	H = np.linspace(0.0, 1.0, 200)
-	VV, HH = np.meshgrid(V, H)
+	V, H, VV, HH, TF, TF_line = make_grid() if grid is None else grid
 
 	# Vector field
 	dVdt = -gL * (VV - EL) - gH * HH
-	TF = tf_depol(VV)
-	H_inf = hill(TF, n)
+	H_inf = hill(TF, n, clip=False)
 	dHdt = k_prod * H_inf - k_deg * HH
 
-	speed = np.sqrt(dVdt**2 + dHdt**2)
-	dVdt_n = dVdt / (speed + 1e-9)
-	dHdt_n = dHdt / (speed + 1e-9)
+	inv_speed = np.reciprocal(np.sqrt(dVdt**2 + dHdt**2) + 1e-9)
+	dVdt_n = np.multiply(dVdt, inv_speed, out=dVdt)
+	dHdt_n = np.multiply(dHdt, inv_speed, out=dHdt)
 
 	fig, ax = plt.subplots(figsize=(6, 5))
 
@@ -48,8 +66,7 @@ def phase_plane(n: float = 2.0, out_path: str | Path = "results/phase_plane_n2.p
 	ax.plot(V, H_V_null, linestyle="--", label="dV/dt = 0")
 
 	# Nullcline dH/dt = 0 -> H = (k_prod/k_deg) * Hill(TF(V))
-	TF_line = tf_depol(V)
-	H_H_null = (k_prod / k_deg) * hill(TF_line, n)
+	H_H_null = (k_prod / k_deg) * hill(TF_line, n, clip=False)
 	ax.plot(V, H_H_null, linestyle="-", label="dH/dt = 0")
 
 	ax.set_xlabel("V (mV)")
@@ -67,12 +84,25 @@ def phase_plane(n: float = 2.0, out_path: str | Path = "results/phase_plane_n2.p
 
 
 def main() -> None:
+	ap = argparse.ArgumentParser()
+	ap.add_argument("--force", action="store_true", help="re-render even if the figures are up to date")
+	args = ap.parse_args()
+
 	# Example: two panels for low vs high cooperativity
 	base = Path("results")
 	(base / "phase_planes").mkdir(exist_ok=True)
 
-	for n in (1.2, 3.0):
-		phase_plane(n=n, out_path=base / "phase_planes" / f"phase_plane_n{n:.1f}.png")
+	# The figures depend only on this script's parameters
+	me = Path(__file__)
+	todo = {n: base / "phase_planes" / f"phase_plane_n{n:.1f}.png" for n in (1.2, 3.0)}
+	todo = {n: out for n, out in todo.items() if args.force or is_stale(out, me)}
+	if not todo:
+		print("Phase planes are up to date (use --force to re-render)")
+		return
+
+	grid = make_grid()
+	for n, out in todo.items():
+		phase_plane(n=n, out_path=out, grid=grid)
 
 
 if __name__ == "__main__":
@@ -5,6 +5,15 @@ from typing import Tuple, Optional
 import numpy as np
 
 
+def hill_response(s, n: float, Kn: float):
+	"""
+	Hill activation H(s) = s^n / (K^n + s^n) for s >= 0, given K^n > 0.
+	Elementwise for floats or arrays; skips the pow when n == 1.
+	"""
+	num = s if n == 1.0 else s ** n
+	return num / (Kn + num)
+
+
 @dataclass
 class ActuationConfig:
 	# Maximal actuation parameters when fully ON and energy is OK
@@ -21,6 +30,51 @@ class ActuationConfig:
 	hill_input_scale: float = 1.0  # Optional scaling of TF_depol before Hill
 
 
+@dataclass(frozen=True, slots=True)
+class PulseParams:
+	"""
+	Pulse and Hill constants resolved from an ActuationConfig once, shared by
+	PulseActuator and BatchPulseActuator so their gating cannot drift apart.
+	`amp` / `duty` are (low-energy cap, nominal) pairs, indexed by E_ok.
+	"""
+	amp: Tuple[float, float]
+	duty: Tuple[float, float]
+	period: float
+	refractory: float
+	hill_n: float
+	hill_K: float
+	hill_scale: float
+	hill_Kn: float
+
+	@classmethod
+	def from_config(cls, cfg: ActuationConfig) -> "PulseParams":
+		cap = cfg.cap_when_lowE
+		hill_n = max(1.0, float(cfg.hill_n))
+		hill_K = float(cfg.hill_K)
+		return cls(
+			amp=(float(cap.get("amplitude_mV", 0.0)), float(cfg.amplitude_mV)),
+			duty=(float(cap.get("duty", 0.0)), float(cfg.duty)),
+			period=float(cfg.period_s),
+			refractory=float(cfg.refractory_s),
+			hill_n=hill_n,
+			hill_K=hill_K,
+			hill_scale=float(cfg.hill_input_scale),
+			# K^n is fixed for the actuator's lifetime; cache it once
+			hill_Kn=hill_K ** hill_n if hill_K > 0.0 else 0.0,
+		)
+
+	def hill(self, tf_depol) -> np.ndarray:
+		"""
+		Cooperative Hill response H in [0,1] for the depolarization TF,
+		elementwise: H(s) = s^n / (K^n + s^n) with s = max(0, scale*TF_depol)
+		(NaN counts as 0), n >= 1. With K <= 0, fully ON once s > 0.
+		"""
+		s = np.fmax(0.0, np.asarray(tf_depol, dtype=float) * self.hill_scale)
+		if self.hill_K <= 0.0:
+			return (s > 0.0).astype(float)
+		return np.clip(hill_response(s, self.hill_n, self.hill_Kn), 0.0, 1.0)
+
+
 class PulseActuator:
 	"""
 	Hyperpolarizing pulse generator implementing the Factor H arm:
@@ -38,33 +92,13 @@ class PulseActuator:
 		self.dt = float(dt)
 		self.t = 0.0
 		self._next_ok_time = 0.0
+		self._params = PulseParams.from_config(cfg)
 
 	def _hill(self, tf_depol: Optional[float]) -> float:
-		"""
-		Cooperative Hill response H in [0,1] for the depolarization TF.
-
-		H(s) = s^n / (K^n + s^n),  with s >= 0, n >= 1, K > 0.
-		If tf_depol is None, return 1.0 (no modulation).
-		"""
+		"""Hill factor H in [0,1] for the depolarization TF; 1.0 (no modulation) if None."""
 		if tf_depol is None:
 			return 1.0
-
-		n = max(1.0, float(self.cfg.hill_n))
-		K = float(self.cfg.hill_K)
-		s = max(0.0, float(tf_depol) * float(self.cfg.hill_input_scale))
-
-		if K <= 0.0:
-			# Degenerate: treat as always fully ON once s>0
-			return 1.0 if s > 0.0 else 0.0
-
-		# Standard Hill form, numerically safe
-		num = s ** n
-		denom = (K ** n) + num
-		if denom <= 0.0:
-			return 0.0
-		H = num / denom
-		# Clamp to [0,1]
-		return float(max(0.0, min(1.0, H)))
+		return float(self._params.hill(tf_depol))
 
 	def step(
 		self,
@@ -72,7 +106,8 @@ class PulseActuator:
 		E_ok: bool,
 		shape: Tuple[int, int],
 		depol_signal: Optional[float] = None,
-	) -> np.ndarray:
+		materialize: bool = True,
+	) -> np.ndarray | float:
 		"""
 		One step of the actuator.
 
@@ -87,44 +122,144 @@ class PulseActuator:
 		depol_signal : float in [0,1], optional
 		    Domain-level depolarization signal driving TF_depol; in this model
 		    we use the mean LOW occupancy fraction from Recorder.
+		materialize : bool, default True
+		    If False, return the (spatially uniform) amplitude as a float instead
+		    of allocating an (h, w) grid; it broadcasts wherever the grid would.
 
 		Returns
 		-------
-		u_act : np.ndarray
+		u_act : np.ndarray or float
 		    Hyperpolarizing current (mV-equivalent) over the grid.
 		"""
+		amp = self._tick(allow, E_ok, depol_signal)
+		if not materialize:
+			return amp
+		return np.full(shape, amp, dtype=float)
+
+	def _tick(self, allow: bool, E_ok: bool, depol_signal: Optional[float]) -> float:
+		"""Advance time by dt and return the uniform pulse amplitude (0.0 when off)."""
 		self.t += self.dt
 		if not allow:
-			return np.zeros(shape, dtype=float)
+			return 0.0
 		if self.t < self._next_ok_time:
-			return np.zeros(shape, dtype=float)
+			return 0.0
 
 		# Base parameters (maximal, before Hill scaling)
-		if E_ok:
-			base_amp = float(self.cfg.amplitude_mV)
-			base_duty = float(self.cfg.duty)
-		else:
-			base_amp = float(self.cfg.cap_when_lowE.get("amplitude_mV", 0.0))
-			base_duty = float(self.cfg.cap_when_lowE.get("duty", 0.0))
+		p = self._params
+		base_amp = p.amp[1] if E_ok else p.amp[0]
+		base_duty = p.duty[1] if E_ok else p.duty[0]
 
-		if base_duty <= 0.0 or self.cfg.period_s <= 0.0:
-			return np.zeros(shape, dtype=float)
+		if base_duty <= 0.0 or p.period <= 0.0:
+			return 0.0
 
 		# Phase inside the duty window
-		phase = (self.t % float(self.cfg.period_s)) / float(self.cfg.period_s)
+		phase = (self.t % p.period) / p.period
 		is_on = phase < base_duty
 		if not is_on:
-			return np.zeros(shape, dtype=float)
+			return 0.0
 
 		# Hill-modulated amplitude (Factor H output)
 		H = self._hill(depol_signal)  # in [0,1]
 		if H <= 0.0:
-			return np.zeros(shape, dtype=float)
+			return 0.0
 
 		amp = base_amp * H  # note: base_amp is negative for hyperpolarization
 
 		# Emit one period of pulses, then enforce refractory after the on-window
-		u = np.full(shape, amp, dtype=float)
-		end_of_on = self.t + (base_duty - phase) * float(self.cfg.period_s)
-		self._next_ok_time = max(self._next_ok_time, end_of_on + float(self.cfg.refractory_s))
-		return u
+		end_of_on = self.t + (base_duty - phase) * p.period
+		self._next_ok_time = max(self._next_ok_time, end_of_on + p.refractory)
+		return amp
+
+	def step_batch(
+		self,
+		allow: np.ndarray | bool,
+		E_ok: np.ndarray | bool,
+		n_steps: int,
+		depol_signal: Optional[np.ndarray | float] = None,
+	) -> np.ndarray:
+		"""
+		Advance the actuator by `n_steps` ticks at once.
+
+		Equivalent to calling `step` once per tick with the per-tick inputs, but
+		since the output is spatially uniform it returns only the amplitude trace
+		of shape (n_steps,); callers broadcast it onto the grid at use time.
+		`allow`, `E_ok` and `depol_signal` may be scalars or (n_steps,) arrays.
+		"""
+		n = int(n_steps)
+		if n <= 0:
+			return np.zeros(0, dtype=float)
+		allow = np.broadcast_to(np.asarray(allow, dtype=bool), (n,))
+		E_ok = np.broadcast_to(np.asarray(E_ok, dtype=bool), (n,))
+
+		# Tick times, accumulated exactly like repeated `self.t += self.dt`
+		t = np.cumsum(np.concatenate(([self.t], np.full(n, self.dt))))[1:]
+		self.t = float(t[-1])
+
+		amps = np.zeros(n, dtype=float)
+		p = self._params
+		period = p.period
+		if period <= 0.0:
+			return amps
+
+		base_amp = np.where(E_ok, p.amp[1], p.amp[0])
+		base_duty = np.where(E_ok, p.duty[1], p.duty[0])
+		phase = (t % period) / period
+		if depol_signal is None:
+			H = np.ones(n, dtype=float)
+		else:
+			H = np.broadcast_to(p.hill(depol_signal), (n,))
+
+		# Ticks that would pulse if not refractory; only these need the
+		# sequential refractory check
+		candidates = np.flatnonzero(allow & (base_duty > 0.0) & (phase < base_duty) & (H > 0.0))
+		refractory = p.refractory
+		for i in candidates:
+			if t[i] < self._next_ok_time:
+				continue
+			amps[i] = base_amp[i] * H[i]
+			end_of_on = t[i] + (base_duty[i] - phase[i]) * period
+			self._next_ok_time = max(self._next_ok_time, end_of_on + refractory)
+		return amps
+
+
+class BatchPulseActuator:
+	"""
+	PulseActuator for n domains stepped together: all domains share the clock
+	(one tick of dt per step) and each keeps its own refractory deadline.
+	`step` returns the (n,) uniform pulse amplitudes, equal to calling
+	PulseActuator.step on n separate actuators with the per-domain inputs.
+	"""
+
+	def __init__(self, cfg: ActuationConfig, dt: float, n: int):
+		self.cfg = cfg
+		self.dt = float(dt)
+		self.n = int(n)
+		self.t = 0.0
+		self._next_ok_time = np.zeros(self.n, dtype=float)
+		self._params = PulseParams.from_config(cfg)
+
+	def step(self, allow: np.ndarray, E_ok: np.ndarray, depol_signal: Optional[np.ndarray] = None) -> np.ndarray:
+		"""Advance all domains by dt; `allow`, `E_ok`, `depol_signal` are (n,) arrays."""
+		self.t += self.dt
+		amps = np.zeros(self.n, dtype=float)
+		p = self._params
+		if p.period <= 0.0:
+			return amps
+		allow = np.asarray(allow, dtype=bool)
+		E_ok = np.asarray(E_ok, dtype=bool)
+		base_amp = np.where(E_ok, p.amp[1], p.amp[0])
+		base_duty = np.where(E_ok, p.duty[1], p.duty[0])
+		phase = (self.t % p.period) / p.period
+
+		# Domains that pulse this tick, before the Hill factor
+		on = allow & (self.t >= self._next_ok_time) & (base_duty > 0.0) & (phase < base_duty)
+		if not on.any():
+			return amps
+		H = np.ones(self.n, dtype=float) if depol_signal is None else p.hill(depol_signal)
+		on &= H > 0.0
+
+		amps[on] = base_amp[on] * H[on]
+		# One period of pulses, then refractory after the on-window
+		end_of_on = self.t + (base_duty[on] - phase) * p.period
+		self._next_ok_time[on] = np.maximum(self._next_ok_time[on], end_of_on + p.refractory)
+		return amps
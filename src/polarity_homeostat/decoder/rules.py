@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Optional, Tuple
 
+import numpy as np
+
 
 @dataclass
 class RulesThresholds:
@@ -66,23 +68,25 @@ class RulesDecoder:
 		offset_high = (global_v_offset_mV >= self.th.global_v_offset_mV)
 		domain_high = (domain_low_fraction >= self.th.domain_low_fraction)
 
-		# REPAIR conditions (5 total when including context signals)
-		repair_conds = [
-			low_occ >= self.th.low_occ_threshold,
-			mismatch <= self.th.mismatch_ok,
-			E >= self.th.energy_ok,
-			plv_bad,
-			offset_high or domain_high,
-		]
-		repair_score = sum(1.0 for c in repair_conds if c) / float(len(repair_conds))
-
-		# REST conditions
-		rest_conds = [
-			plv_ok,
-			low_occ < self.th.low_occ_threshold,
-			mismatch > self.th.mismatch_ok,
-		]
-		rest_score = sum(1.0 for c in rest_conds if c) / float(len(rest_conds))
+		# REPAIR conditions (5 total when including context signals);
+		# bools summed directly, no per-call list/generator. The sum starts
+		# from an int so NumPy bool terms add as integers, not as logical OR
+		repair_hits = (
+			int(low_occ >= self.th.low_occ_threshold)
+			+ (mismatch <= self.th.mismatch_ok)
+			+ (E >= self.th.energy_ok)
+			+ plv_bad
+			+ (offset_high or domain_high)
+		)
+		repair_score = repair_hits / 5.0
+
+		# REST conditions (3 total)
+		rest_hits = (
+			int(plv_ok)
+			+ (low_occ < self.th.low_occ_threshold)
+			+ (mismatch > self.th.mismatch_ok)
+		)
+		rest_score = rest_hits / 3.0
 
 		# PRUNE strict: require sustained prune_cond
 		if self.th.prune_enabled and prune_cond and self._prune_steps >= max(1, int(self.th.prune_dwell_steps)):
@@ -105,6 +109,10 @@ class RulesDecoder:
 		global_v_offset_mV: float,
 		domain_low_fraction: float,
 	) -> int:
+		low_occ, mismatch, E = float(low_occ), float(mismatch), float(E)
+		global_v_offset_mV = float(global_v_offset_mV)
+		domain_low_fraction = float(domain_low_fraction)
+
 		# Decrement hold counter each call; never below zero
 		if self._hold_steps > 0:
 			self._hold_steps -= 1
@@ -124,8 +132,14 @@ class RulesDecoder:
 		rest_s, repair_s, prune_s = self._scores(
 			low_occ, mismatch, E, plv, global_v_offset_mV, domain_low_fraction, prune_cond
 		)
-		scores = [rest_s, repair_s, prune_s]
-		proposed = int(max(range(3), key=lambda i: scores[i]))
+		scores = (rest_s, repair_s, prune_s)
+		# Winner-take-all; ties go to the lower index (REST < REPAIR < PRUNE)
+		if rest_s >= repair_s and rest_s >= prune_s:
+			proposed = 0
+		elif repair_s >= prune_s:
+			proposed = 1
+		else:
+			proposed = 2
 
 		current = self._last_action
 		if proposed != current:
@@ -142,3 +156,89 @@ class RulesDecoder:
 			return proposed
 		# No switch
 		return current
+
+
+class BatchRulesDecoder:
+	"""
+	RulesDecoder for n independent domains at once: the same scores, hysteresis
+	and dwell rules, with the per-domain state held in arrays. Inputs are
+	(n,) arrays except the global plv / offset; decide() returns the (n,)
+	actions. Domains outside `active` report REST and their state is frozen,
+	as if their decoder had not been called.
+	"""
+	def __init__(self, thresholds: RulesThresholds, stability: DecoderStability, n: int):
+		self.th = thresholds
+		self.st = stability
+		self.n = int(n)
+		self._last_action = np.zeros(self.n, dtype=np.int8)
+		self._hold_steps = np.zeros(self.n, dtype=np.int64)
+		self._prune_steps = np.zeros(self.n, dtype=np.int64)
+
+	def decide(
+		self,
+		low_occ: np.ndarray,
+		mismatch: np.ndarray,
+		E: np.ndarray,
+		plv: Optional[float],
+		global_v_offset_mV: float,
+		domain_low_fraction: np.ndarray,
+		active: Optional[np.ndarray] = None,
+	) -> np.ndarray:
+		th = self.th
+		low_occ = np.asarray(low_occ, dtype=float)
+		mismatch = np.asarray(mismatch, dtype=float)
+		E = np.asarray(E, dtype=float)
+		domain_low_fraction = np.asarray(domain_low_fraction, dtype=float)
+		active = np.ones(self.n, dtype=bool) if active is None else np.asarray(active, dtype=bool)
+
+		# Decrement hold counters; never below zero
+		hold = self._hold_steps
+		np.subtract(hold, 1, out=hold, where=active & (hold > 0))
+
+		# Prune evidence dwell counters
+		if th.prune_enabled:
+			prune_cond = (
+				(low_occ >= th.prune_low_occ_threshold)
+				& (E <= th.prune_energy_max)
+				& (mismatch >= th.prune_mismatch_min)
+			)
+			self._prune_steps = np.where(
+				active, np.where(prune_cond, self._prune_steps + 1, 0), self._prune_steps
+			)
+			prune_s = (prune_cond & (self._prune_steps >= max(1, int(th.prune_dwell_steps)))).astype(float)
+		else:
+			self._prune_steps[active] = 0
+			prune_s = np.zeros(self.n)
+
+		# Soft scores, as in RulesDecoder._scores (already within [0, 1])
+		plv_ok = True if plv is None else (plv >= th.healthy_plv_min)
+		plv_bad = False if plv is None else (plv < th.healthy_plv_min)
+		offset_high = global_v_offset_mV >= th.global_v_offset_mV
+		domain_high = domain_low_fraction >= th.domain_low_fraction
+		repair_hits = (
+			(low_occ >= th.low_occ_threshold).astype(np.int64)
+			+ (mismatch <= th.mismatch_ok)
+			+ (E >= th.energy_ok)
+			+ plv_bad
+			+ (offset_high | domain_high)
+		)
+		repair_s = repair_hits / 5.0
+		rest_hits = (
+			(low_occ < th.low_occ_threshold).astype(np.int64)
+			+ (mismatch > th.mismatch_ok)
+			+ plv_ok
+		)
+		rest_s = rest_hits / 3.0
+
+		# Winner-take-all; ties go to the lower index (REST < REPAIR < PRUNE)
+		proposed = np.where(
+			(rest_s >= repair_s) & (rest_s >= prune_s), 0, np.where(repair_s >= prune_s, 1, 2)
+		)
+		scores = np.stack((rest_s, repair_s, prune_s))
+		cols = np.arange(self.n)
+		current = self._last_action
+		margin = scores[proposed, cols] - scores[current, cols]
+		switch = active & (proposed != current) & (hold == 0) & (margin > self.st.hysteresis_margin)
+		current[switch] = proposed[switch]
+		hold[switch] = max(0, int(self.st.decision_dwell))
+		return np.where(active, current, 0).astype(np.int8)
@@ -1,34 +1,36 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Optional, Sequence
 import math
 import numpy as np
 
 
-def compute_recovery_time(domain_low_frac: List[float], dt: float, threshold: float = 0.10, dwell_s: float = 60.0) -> Optional[int]:
+def compute_recovery_time(domain_low_frac: Sequence[float] | np.ndarray, dt: float, threshold: float = 0.10, dwell_s: float = 60.0) -> Optional[int]:
 	"""
 	Return the first step index at which domain_low_fraction falls below `threshold`
 	and stays below for at least `dwell_s`. If never satisfied, return None.
 	"""
-	if not domain_low_frac:
+	if len(domain_low_frac) == 0:
 		return None
 	dwell_steps = max(1, int(round(dwell_s / max(dt, 1e-9))))
 	vals = np.asarray(domain_low_frac, dtype=float)
-	below = vals < float(threshold)
-	count = 0
-	for i, b in enumerate(below):
-		count = count + 1 if b else 0
-		if count >= dwell_steps:
-			return i - dwell_steps + 1
-	return None
+	below = (vals < float(threshold)).astype(np.int8)
+	# Run-length scan: +1 marks the start of a below-threshold run, -1 its end
+	edges = np.diff(np.concatenate(([0], below, [0])))
+	starts = np.flatnonzero(edges == 1)
+	ends = np.flatnonzero(edges == -1)
+	ok = np.flatnonzero(ends - starts >= dwell_steps)
+	if ok.size == 0:
+		return None
+	return int(starts[ok[0]])
 
 
-def compute_flicker_rate(actions: List[int], dt: float, warmup_s: float = 0.0) -> float:
+def compute_flicker_rate(actions: Sequence[int] | np.ndarray, dt: float, warmup_s: float = 0.0) -> float:
 	"""
 	Return fraction of time steps with an action switch after warmup.
 	If insufficient data, returns 0.0.
 	"""
-	if not actions:
+	if len(actions) == 0:
 		return 0.0
 	warmup_steps = max(0, int(round(warmup_s / max(dt, 1e-9))))
 	acts = np.asarray(actions, dtype=int)
@@ -39,14 +41,15 @@ def compute_flicker_rate(actions: List[int], dt: float, warmup_s: float = 0.0) -
 	return float(switches) / float(acts.size - 1)
 
 
-def compute_plv_retention(plv_series: List[Optional[float]], dt: float, window_s: float = 300.0) -> Optional[float]:
+def compute_plv_retention(plv_series: Sequence[Optional[float]] | np.ndarray, dt: float, window_s: float = 300.0) -> Optional[float]:
 	"""
 	Compute mean PLV in the first and last `window_s` and return last/first (clipped 0..1).
-	If windows cannot be formed or first mean is ~0, return None.
+	Missing samples may be None or NaN. If windows cannot be formed or first mean is ~0,
+	return None.
 	"""
-	if not plv_series:
+	if len(plv_series) == 0:
 		return None
-	vals = np.array([np.nan if v is None else float(v) for v in plv_series], dtype=float)
+	vals = np.asarray(plv_series, dtype=float)  # None -> NaN
 	win = max(1, int(round(window_s / max(dt, 1e-9))))
 	if vals.size < 2 * win:
 		return None
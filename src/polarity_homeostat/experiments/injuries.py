@@ -11,6 +11,8 @@ def apply_domain_injuries(
 	E: np.ndarray,
 	domain_slices: Sequence[DomainSlice],
 	injury_cfg: List[Dict],
+	*,
+	copy: bool = True,
 ) -> tuple[np.ndarray, np.ndarray]:
 	"""
 	Apply domain-specific 'injuries' at t = 0.
@@ -23,13 +25,15 @@ def apply_domain_injuries(
 	  - E0: float (optional)
 	        Set E in that domain to this value (e.g., lower ATP).
 
-	Returns updated (V, E) arrays.
+	Returns updated (V, E) arrays. With copy=False, V and E are modified in
+	place and returned (for callers that own them and do not need the
+	pre-injury state).
 	"""
 	if not injury_cfg:
 		return V, E
 
-	V_new = V.copy()
-	E_new = E.copy()
+	V_new = V.copy() if copy else V
+	E_new = E.copy() if copy else E
 
 	n_domains = len(domain_slices)
 
@@ -0,0 +1,60 @@
+"""
+Compile the numba kernels ahead of a run.
+
+All kernels are declared with cache=True, so a compiled specialization is
+stored next to the sources and reused by later processes. Running this once
+after installing (or in a CI setup step) populates that cache for the grid
+dtypes the simulator uses, so the first simulation does not pay the JIT
+latency:
+
+  python -m polarity_homeostat.experiments.precompile
+"""
+
+import argparse
+
+import numpy as np
+
+from ..utils.jit import HAVE_NUMBA
+from ..utils.math_utils import _domain_means_kernel, _domain_means_kernel_parallel, step_reductions
+from ..sensing.recorder import _fused_update_kernel, _neighbor_mismatch_kernel
+from ..model import _kernels as model_kernels
+
+
+def precompile(dtypes=("float64", "float32")) -> bool:
+	"""Trigger compilation of every kernel for each grid dtype; False without numba."""
+	if not HAVE_NUMBA:
+		return False
+	for dtype in dtypes:
+		V = np.full((3, 3), -15.0, dtype=dtype)
+		low_occ = np.zeros((3, 3), dtype=dtype)
+		E = np.ones((3, 3), dtype=dtype)
+		low_state = np.zeros((3, 3), dtype=bool)
+		mismatch = np.empty((3, 3), dtype=dtype)
+		_fused_update_kernel(V, low_state, low_occ, -12.0, -18.0, 0.1, mismatch)
+		_neighbor_mismatch_kernel(low_state, mismatch)
+		step_reductions(V, low_occ, E, mismatch, low_state, 0.2)
+		for domain_kernel in (_domain_means_kernel, _domain_means_kernel_parallel):
+			domain_kernel(low_occ, mismatch, low_state, E, 3, 3, np.empty((4, 1)))
+		u_act = np.zeros_like(V)
+		for tissue_step in (model_kernels.tissue_step, model_kernels.tissue_step_parallel):
+			for neumann in (False, True):
+				tissue_step(V, u_act, V, True, np.empty_like(V), 0.1, 0.05, -60.0, 0.2, neumann)
+		for energy_step in (model_kernels.energy_step, model_kernels.energy_step_parallel):
+			energy_step(E, u_act, np.empty_like(E), 0.1, 0.02, 0.01, 0.01, 0.1)
+	return True
+
+
+def main():
+	parser = argparse.ArgumentParser()
+	parser.add_argument(
+		"--dtypes", nargs="+", default=["float64", "float32"], help="Grid dtypes to compile for"
+	)
+	args = parser.parse_args()
+	if precompile(args.dtypes):
+		print(f"Compiled kernels for {', '.join(args.dtypes)}", flush=True)
+	else:
+		print("numba is not installed; nothing to compile", flush=True)
+
+
+if __name__ == "__main__":
+	main()
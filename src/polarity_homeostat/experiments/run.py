@@ -1,18 +1,30 @@
 import argparse
 import json
+from dataclasses import dataclass
 from pathlib import Path
 import yaml
 import numpy as np
-import csv
+import pandas as pd
+
+try:
+	from yaml import CSafeLoader as SafeLoader  # libyaml C parser
+except ImportError:
+	from yaml import SafeLoader
+
+try:
+	import pyarrow as pa
+	import pyarrow.parquet as pq
+except ImportError:
+	pa = None
 
 from ..sensing.recorder import Recorder, RecorderConfig
 from ..sensing.osc import OscillationDetector, OscConfig
 from ..model.tissue import Tissue, TissueConfig
 from ..model.energy import Energy, EnergyConfig
-from ..utils.math_utils import estimate_coupling_shortlag
-from ..safety.gates import energy_gate, compute_adaptive_emin, oscillation_gate, geometry_gate
-from ..actuation.pulses import PulseActuator, ActuationConfig
-from ..decoder.rules import RulesDecoder, RulesThresholds, DecoderStability
+from ..utils.math_utils import domain_means, estimate_coupling_shortlag, step_reductions, tile_means
+from ..safety.gates import compute_adaptive_emin, oscillation_gate, geometry_gate_batch
+from ..actuation.pulses import BatchPulseActuator, ActuationConfig
+from ..decoder.rules import BatchRulesDecoder, RulesThresholds, DecoderStability
 from ..eval.metrics import compute_recovery_time, compute_flicker_rate, compute_plv_retention
 from .injuries import apply_domain_injuries
 
@@ -53,7 +65,7 @@ def parse_args():
 
 def load_config(path: str) -> dict:
 	with open(path, "r", encoding="utf-8") as f:
-		return yaml.safe_load(f)
+		return yaml.load(f, Loader=SafeLoader)
 
 
 def ensure_out_dir(out_dir: str) -> Path:
@@ -62,12 +74,101 @@ def ensure_out_dir(out_dir: str) -> Path:
 	return p
 
 
-def main():
-	args = parse_args()
-	cfg = load_config(args.config)
-	out_dir = ensure_out_dir(args.out)
-	print(f"Starting run → out={out_dir}", flush=True)
+ATLAS_COLS = [
+	"t",
+	"action",
+	"mean_V",
+	"LOW_occ",
+	"mismatch",
+	"E",
+	"PLV",
+	"global_v_offset",
+	"domain_low_fraction",
+	"redox_bit",
+	"D_est",
+]
+
+DOMAIN_ATLAS_COLS = [
+	"t",
+	"domain_id",
+	"action",
+	"mean_V_dom",
+	"LOW_occ_dom",
+	"mismatch_dom",
+	"E_dom",
+	"domain_low_fraction_dom",
+	"controller_health",
+]
+
+
+def atlas_frame(columns: list, buf: np.ndarray, int_cols: tuple = ()) -> pd.DataFrame:
+	"""
+	Wrap a preallocated float64 atlas buffer (one row per logged sample, NaN
+	for missing values) as a DataFrame, casting the integer-valued columns.
+	"""
+	df = pd.DataFrame(buf, columns=columns, copy=False)
+	return df.astype({c: np.int64 for c in int_cols}) if int_cols else df
+
+
+def write_atlas(path: Path, df: pd.DataFrame) -> bool:
+	"""
+	Write an atlas CSV with NaN as blank fields. The CSV always comes from
+	DataFrame.to_csv, so its text does not depend on optional packages; with
+	pyarrow installed a Parquet (snappy) sidecar is also written next to it so
+	the plotting scripts can skip text parsing. Returns whether the sidecar
+	was written.
+	"""
+	df.to_csv(path, index=False, na_rep="")
+	if pa is None:
+		return False
+	table = pa.Table.from_pandas(df, preserve_index=False)  # NaN -> null
+	pq.write_table(table, path.with_suffix(".parquet"), compression="snappy")
+	return True
+
+
+@dataclass(frozen=True, slots=True)
+class RunParams:
+	"""Scalar settings read by the step loop, resolved from the YAML config once."""
+	Emin: float
+	adaptive_emin_enabled: bool
+	adaptive_emin_k: float
+	adaptive_emin_min: float
+	enable_osc_gate: bool
+	enable_energy_gate: bool
+	enable_geometry_gate: bool
+	gvo_thresh_mV: float
+	min_bad_duration_s: float
+
+	@classmethod
+	def from_config(cls, cfg: dict) -> "RunParams":
+		Emin = float(cfg["energy"]["Emin"])
+		adaptive = cfg.get("energy_extras", {}).get("adaptive_emin", {})
+		safety = cfg["safety"]
+		return cls(
+			Emin=Emin,
+			adaptive_emin_enabled=bool(adaptive.get("enabled", False)),
+			adaptive_emin_k=float(adaptive.get("k", 0.0)),
+			adaptive_emin_min=float(adaptive.get("min", Emin)),
+			enable_osc_gate=bool(safety.get("enable_osc_gate", True)),
+			enable_energy_gate=bool(safety.get("enable_energy_gate", True)),
+			enable_geometry_gate=bool(safety.get("enable_geometry_gate", True)),
+			gvo_thresh_mV=float(cfg.get("thresholds", {}).get("global_v_offset_mV", 10.0)),
+			min_bad_duration_s=float(cfg.get("osc_extras", {}).get("min_bad_duration_s", 0.0)),
+		)
 
+
+@dataclass
+class SimulationResult:
+	event_atlas: pd.DataFrame
+	domain_atlas: pd.DataFrame
+	summary: dict
+
+
+def simulate(cfg: dict) -> SimulationResult:
+	"""
+	Run one simulation for a parsed config and return the atlases and summary
+	metrics in memory; no files are written (see `write_outputs`).
+	"""
 	# Build configs
 	tcfg = cfg["tissue"]
 	ecfg = cfg["energy"]
@@ -102,8 +203,14 @@ def main():
 
 	min_coupling = float(geom_cfg.get("min_coupling_for_consensus", 0.1))
 	estimate_coupling = bool(geom_cfg.get("estimate_coupling", True))
+	# Recompute D_est for the geometry gate every `coupling_stride` steps and
+	# reuse the last estimate in between (1 = every step)
+	coupling_stride = max(1, int(geom_cfg.get("coupling_stride", 1)))
+	params = RunParams.from_config(cfg)
 
 	grid_h, grid_w = int(tcfg["grid"][0]), int(tcfg["grid"][1])
+	# Precision of the V/E/low_occ grids (float64 unless configured)
+	grid_dtype = str(tcfg.get("dtype", "float64"))
 	dt = float(tcfg["dt"])
 	steps = int(tcfg["steps"])
 	atlas_stride = int(cfg.get("logging", {}).get("atlas_stride", 10))
@@ -149,7 +256,7 @@ def main():
 		controller_health = rng_drop.random(n_domains) > drop_frac
 
 	# Core components
-	recorder = Recorder(rcfg, grid=(grid_h, grid_w), dt=dt)
+	recorder = Recorder(rcfg, grid=(grid_h, grid_w), dt=dt, dtype=grid_dtype)
 	osc = OscillationDetector(ocfg, grid=(grid_h, grid_w), dt=dt)
 
 	tissue = Tissue(
@@ -161,6 +268,7 @@ def main():
 			coupling_D=float(tcfg["coupling_D"]),
 			noise_rms=float(tcfg.get("noise_rms", 0.0)),
 			boundary=str(tcfg.get("boundary", "periodic")),
+			dtype=grid_dtype,
 		),
 		seed=seed,
 	)
@@ -174,12 +282,13 @@ def main():
 			beta_tnt_flux=float(ecfg["beta_tnt_flux"]),
 			gamma_decay=float(ecfg["gamma_decay"]),
 			Emin=float(ecfg["Emin"]),
+			dtype=grid_dtype,
 		)
 	)
 
-	# One decoder + actuator per domain
-	decoders = [RulesDecoder(thresholds=th, stability=stab) for _ in range(n_domains)]
-	actuators = [PulseActuator(a_cfg, dt=dt) for _ in range(n_domains)]
+	# Decoder and actuator state for all domains
+	decoder = BatchRulesDecoder(thresholds=th, stability=stab, n=n_domains)
+	actuator = BatchPulseActuator(a_cfg, dt=dt, n=n_domains)
 
 	# Initial state: uniform V/E, then domain-specific injuries
 	tissue.set_initial(-18.0)
@@ -188,222 +297,200 @@ def main():
 
 	injuries_cfg = cfg.get("injuries", {}).get("domains", [])
 	if injuries_cfg:
-		V0 = tissue.V.copy()
-		E0_grid = energy.E.copy()
-		V0, E0_grid = apply_domain_injuries(V0, E0_grid, domain_slices, injuries_cfg)
-		tissue.V[...] = V0
-		energy.E[...] = E0_grid
+		apply_domain_injuries(tissue.V, energy.E, domain_slices, injuries_cfg, copy=False)
 
 	# Optional window for coupling estimation
-	V_window = []
+	# (ring buffer of the last max_frames V grids; win_idx is the next slot and,
+	# once full, the oldest frame)
 	max_frames = 50
+	V_window = np.empty((max_frames, grid_h, grid_w), dtype=grid_dtype)
+	win_idx = 0
+	win_count = 0
+	D_est = None
 
 	# Metric series (global)
-	actions_series = []
-	plv_series = []
-	domain_low_series = []
+	# (one entry per step; PLV is NaN until the detector has enough samples)
+	actions_series = np.zeros(steps, dtype=np.int8)
+	plv_series = np.full(steps, np.nan)
+	domain_low_series = np.zeros(steps)
 
 	# Global V offset persistence
 	gvo_bad_seconds = 0.0
 
-	# Logging
-	atlas_rows = []
-	domain_rows = []
+	# Loop-invariant settings and per-domain constants, bound to locals
+	mismatch_threshold = float(rcfg.mismatch_threshold)
+	Emin = params.Emin
+	adaptive_emin = (params.adaptive_emin_enabled, params.adaptive_emin_k, params.adaptive_emin_min)
+	enable_osc_gate = params.enable_osc_gate
+	enable_energy_gate = params.enable_energy_gate
+	enable_geometry_gate = params.enable_geometry_gate
+	gvo_thresh_mV = params.gvo_thresh_mV
+	min_bad_duration_s = params.min_bad_duration_s
+	all_domains = np.ones(n_domains, dtype=bool)
+	no_domains = np.zeros(n_domains, dtype=bool)
+	domain_ids = np.arange(n_domains)
+	# Actuation grid, rewritten every step; u_act_tiles views it per domain
+	# as (n_dom_h, tile_h, n_dom_w, tile_w)
+	u_act = np.zeros((grid_h, grid_w), dtype=grid_dtype)
+	u_act_tiles = u_act.reshape(n_dom_h, tile_h, n_dom_w, tile_w)
+	# Component methods called every step, looked up once
+	osc_update = osc.update
+	osc_plv = osc.plv_with_persistence
+	recorder_update_all = recorder.update_all
+	recorder_gvo = recorder.global_v_offset
+	decide = decoder.decide
+	actuate = actuator.step
+	tissue_step = tissue.step
+	energy_step = energy.step
+
+	# Logging: one preallocated row per logged step (NaN = blank field)
+	n_logged = len(range(0, steps, atlas_stride))
+	atlas_buf = np.full((n_logged, len(ATLAS_COLS)), np.nan)
+	domain_buf = np.full((n_logged * n_domains, len(DOMAIN_ATLAS_COLS)), np.nan)
+	log_idx = 0
 
 	for step in range(steps):
 		t = step * dt
 
-		# --- Update oscillation detector with current Vmem ---
-		osc.update(tissue.V)
-
 		V = tissue.V
 		E_grid = energy.E
 
-		# --- Local sensing: LOW bands, chronic occupancy, mismatch, offset ---
-		recorder.update_bands(V)
-		recorder.update_low_occupancy()
-
-		mismatch_grid = recorder.neighbor_mismatch(V)
-		mismatch_mean = float(mismatch_grid.mean())
+		# --- Update oscillation detector with current Vmem ---
+		osc_update(V)
 
+		# --- Local sensing: LOW bands, chronic occupancy, mismatch, offset ---
+		mismatch_grid = recorder_update_all(V)
 		low_state_grid = recorder.low_state
 		low_occ_grid = recorder.low_occ
-		low_occ_mean = float(low_occ_grid.mean())
 
-		E_mean = float(E_grid.mean())
-		plv, plv_bad = osc.plv_with_persistence()
-		plv_series.append(plv)
+		# Global means/fractions in one pass over the grids (V is not modified
+		# until tissue.step at the end of the iteration)
+		(
+			mean_V,
+			low_occ_mean,
+			E_mean,
+			mismatch_mean,
+			domain_lowE_fraction,
+			domain_low_frac_global,
+		) = step_reductions(V, low_occ_grid, E_grid, mismatch_grid, low_state_grid, Emin)
+
+		plv, plv_bad = osc_plv()
+		if plv is not None:
+			plv_series[step] = plv
 
-		domain_low_frac_global = float(recorder.domain_low_fraction())
-		domain_low_series.append(domain_low_frac_global)
+		domain_low_series[step] = domain_low_frac_global
 
-		global_v_off = float(recorder.global_v_offset(V))
+		global_v_off = recorder_gvo(V, mean_V=mean_V)
+
+		log_this_step = (step % atlas_stride == 0)
 
 		# --- Estimate coupling for geometry gate (global) ---
-		D_est = None
+		# Frames are recorded every step, but the estimate is only needed when
+		# the geometry gate consumes it or the atlas logs it.
 		if estimate_coupling:
-			V_window.append(V.copy())
-			if len(V_window) > max_frames:
-				V_window.pop(0)
-			if len(V_window) >= 4:
-				D_est = float(estimate_coupling_shortlag(np.stack(V_window, axis=0)))
+			V_window[win_idx] = V
+			win_idx = (win_idx + 1) % max_frames
+			win_count = min(win_count + 1, max_frames)
+			if win_count >= 4 and (
+				log_this_step or (enable_geometry_gate and step % coupling_stride == 0)
+			):
+				if win_count < max_frames:
+					D_est = estimate_coupling_shortlag(V_window[:win_count])
+				else:
+					D_est = estimate_coupling_shortlag(V_window, start=win_idx)
 
 		# --- Energy gate with adaptive Emin (global Emin_eff, domain-local E_k) ---
-		domain_lowE_fraction = float(np.mean(E_grid < float(ecfg["Emin"])))
-		Emin_eff = compute_adaptive_emin(
-			float(ecfg["Emin"]),
-			domain_lowE_fraction,
-			bool(cfg.get("energy_extras", {}).get("adaptive_emin", {}).get("enabled", False)),
-			float(cfg.get("energy_extras", {}).get("adaptive_emin", {}).get("k", 0.0)),
-			float(cfg.get("energy_extras", {}).get("adaptive_emin", {}).get("min", float(ecfg["Emin"]))),
-		)
+		Emin_eff = compute_adaptive_emin(Emin, domain_lowE_fraction, *adaptive_emin)
 
 		# --- Oscillation gate with PLV persistence + global offset override ---
-		OscOK = oscillation_gate(bool(plv_bad)) if cfg["safety"].get("enable_osc_gate", True) else True
+		OscOK = oscillation_gate(bool(plv_bad)) if enable_osc_gate else True
 
-		gvo_thresh = float(cfg.get("thresholds", {}).get("global_v_offset_mV", 10.0))
-		if abs(global_v_off) >= gvo_thresh:
+		if abs(global_v_off) >= gvo_thresh_mV:
 			gvo_bad_seconds += dt
 		else:
 			gvo_bad_seconds = max(0.0, gvo_bad_seconds - dt)
 
 		# If sustained offset high for same persistence window, treat as bad oscillation
-		if gvo_bad_seconds >= float(cfg.get("osc_extras", {}).get("min_bad_duration_s", 0.0)):
+		if gvo_bad_seconds >= min_bad_duration_s:
 			OscOK = True
 
 		# --- Domain-level control loop ---
-		u_act = np.zeros_like(V)
-		max_action_this_step = 0
 
-		log_this_step = (step % atlas_stride == 0)
+		# Per-domain means for all domains at once
+		low_occ_doms, mismatch_doms, low_frac_doms, E_doms = domain_means(
+			low_occ_grid, mismatch_grid, low_state_grid, E_grid, tile_h, tile_w
+		)
 
-		for k, (sl_i, sl_j) in enumerate(domain_slices):
-			V_dom = V[sl_i, sl_j]
-			E_dom = E_grid[sl_i, sl_j]
-
-			low_occ_dom = float(low_occ_grid[sl_i, sl_j].mean())
-			mismatch_dom = float(mismatch_grid[sl_i, sl_j].mean())
-			low_frac_dom = float(low_state_grid[sl_i, sl_j].mean())
-			E_dom_mean = float(E_dom.mean())
-
-			# TF_depol derived from chronic LOW occupancy in this domain
-			tf_depol = max(0.0, min(1.0, low_occ_dom))
-
-			# REST/REPAIR/PRUNE decision for domain k
-			if controller_health[k]:
-				action_k = decoders[k].decide(
-					low_occ=low_occ_dom,
-					mismatch=mismatch_dom,
-					E=E_dom_mean,
-					plv=(plv if plv is not None else None),
-					global_v_offset_mV=global_v_off,
-					domain_low_fraction=low_frac_dom,
-				)
-			else:
-				# Loss-of-function mutation: controller permanently OFF (stays at REST)
-				action_k = 0
-
-			# Domain-level energy & geometry gates
-			Eok_dom = energy_gate(E_dom_mean, Emin_eff) if cfg["safety"].get("enable_energy_gate", True) else True
-			GeomOK_dom = geometry_gate(
-				mismatch_dom,
-				float(rcfg.mismatch_threshold),
-				D_est,
-				min_coupling,
-			) if cfg["safety"].get("enable_geometry_gate", True) else True
-
-			allow_pulse = (
-				actuation_enabled
-				and (action_k == 1)  # REPAIR
-				and Eok_dom
-				and OscOK
-				and GeomOK_dom
-				and controller_health[k]
-			)
+		# REST/REPAIR/PRUNE decisions for all domains; loss-of-function
+		# domains (controller permanently OFF) stay at REST
+		actions = decide(
+			low_occ=low_occ_doms,
+			mismatch=mismatch_doms,
+			E=E_doms,
+			plv=plv,
+			global_v_offset_mV=global_v_off,
+			domain_low_fraction=low_frac_doms,
+			active=controller_health,
+		)
 
-			u_dom = actuators[k].step(
-				allow=allow_pulse,
-				E_ok=Eok_dom,
-				shape=V_dom.shape,
-				depol_signal=tf_depol,
-			)
-			u_act[sl_i, sl_j] += u_dom
-
-			max_action_this_step = max(max_action_this_step, int(action_k))
-
-			# Per-domain logging
-			if log_this_step:
-				domain_rows.append([
-					t,
-					k,
-					int(action_k),
-					float(V_dom.mean()),
-					low_occ_dom,
-					mismatch_dom,
-					E_dom_mean,
-					low_frac_dom,
-					1.0 if controller_health[k] else 0.0,
-				])
+		# Domain-level energy & geometry gates
+		Eok_doms = E_doms >= Emin_eff if enable_energy_gate else all_domains
+		if enable_geometry_gate:
+			GeomOK_doms = geometry_gate_batch(mismatch_doms, mismatch_threshold, D_est, min_coupling)
+		else:
+			GeomOK_doms = all_domains
+		if actuation_enabled and OscOK:
+			allow_doms = (actions == 1) & Eok_doms & GeomOK_doms & controller_health  # REPAIR
+		else:
+			allow_doms = no_domains
+
+		# Pulses for all domains (TF_depol = chronic LOW occupancy per domain),
+		# broadcast onto each domain's tile of the grid
+		u_doms = actuate(
+			allow=allow_doms,
+			E_ok=Eok_doms,
+			depol_signal=np.clip(low_occ_doms, 0.0, 1.0),
+		)
+		u_act_tiles[...] = u_doms.reshape(n_dom_h, 1, n_dom_w, 1)
+
+		max_action_this_step = int(actions.max())
+
+		# Per-domain logging
+		if log_this_step:
+			rows = domain_buf[log_idx * n_domains:(log_idx + 1) * n_domains]
+			rows[:, 0] = t
+			rows[:, 1] = domain_ids
+			rows[:, 2] = actions
+			rows[:, 3] = tile_means(V, tile_h, tile_w)
+			rows[:, 4] = low_occ_doms
+			rows[:, 5] = mismatch_doms
+			rows[:, 6] = E_doms
+			rows[:, 7] = low_frac_doms
+			rows[:, 8] = controller_health
 
 		# Global "action" summary for flicker metric
-		actions_series.append(max_action_this_step)
+		actions_series[step] = max_action_this_step
 
 		# --- Global logging (unchanged schema) ---
-		mean_V = float(V.mean())
 		if log_this_step:
-			atlas_rows.append([
+			atlas_buf[log_idx] = (
 				t,
 				max_action_this_step,
 				mean_V,
 				low_occ_mean,
 				mismatch_mean,
-				float(E_grid.mean()),
-				plv if plv is not None else "",
+				E_mean,
+				np.nan if plv is None else plv,
 				global_v_off,
 				domain_low_frac_global,
 				0.0,  # redox_bit placeholder
-				("" if D_est is None else D_est),
-			])
+				np.nan if D_est is None else D_est,
+			)
+			log_idx += 1
 
 		# --- Advance tissue and energy with total actuation ---
-		tissue.step(u_act=u_act)
-		energy.step(dt=dt, u_act=u_act, u_tnt_ev=0.0)
-
-	# --- Write global event atlas ---
-	atlas_cols = [
-		"t",
-		"action",
-		"mean_V",
-		"LOW_occ",
-		"mismatch",
-		"E",
-		"PLV",
-		"global_v_offset",
-		"domain_low_fraction",
-		"redox_bit",
-		"D_est",
-	]
-	with open(out_dir / "event_atlas.csv", "w", newline="", encoding="utf-8") as f:
-		writer = csv.writer(f)
-		writer.writerow(atlas_cols)
-		writer.writerows(atlas_rows)
-
-	# --- Write per-domain atlas ---
-	domain_atlas_cols = [
-		"t",
-		"domain_id",
-		"action",
-		"mean_V_dom",
-		"LOW_occ_dom",
-		"mismatch_dom",
-		"E_dom",
-		"domain_low_fraction_dom",
-		"controller_health",
-	]
-	with open(out_dir / "domain_atlas.csv", "w", newline="", encoding="utf-8") as f:
-		writer = csv.writer(f)
-		writer.writerow(domain_atlas_cols)
-		writer.writerows(domain_rows)
+		tissue_step(u_act=u_act)
+		energy_step(dt=dt, u_act=u_act, u_tnt_ev=0.0)
 
 	# --- Summary metrics (still global) ---
 	recovery_step = compute_recovery_time(domain_low_series, dt=dt, threshold=0.10, dwell_s=60.0)
@@ -414,20 +501,45 @@ def main():
 		"recovery_time_step": int(recovery_step) if recovery_step is not None else None,
 		"flicker_rate": float(flicker),
 		"PLV_retention": None if plv_ret is None else float(plv_ret),
-		"final_mean_V": float(tissue.V.mean()) if atlas_rows else None,
-		"final_mean_E": float(energy.E.mean()) if atlas_rows else None,
+		"final_mean_V": float(tissue.V.mean()) if n_logged else None,
+		"final_mean_E": float(energy.E.mean()) if n_logged else None,
 		"n_domains": int(n_domains),
 		"domain_tile": [tile_h, tile_w],
 		"controller_dropout_frac": float(drop_frac),
 		"actuation_enabled": bool(actuation_enabled),
-		"final_LOW_occ": float(low_occ_mean) if atlas_rows else None,
-		"final_domain_low_fraction": float(domain_low_series[-1]) if domain_low_series else None,
+		"final_LOW_occ": float(low_occ_mean) if n_logged else None,
+		"final_domain_low_fraction": float(domain_low_series[-1]) if steps else None,
 	}
+	return SimulationResult(
+		event_atlas=atlas_frame(ATLAS_COLS, atlas_buf, int_cols=("action",)),
+		domain_atlas=atlas_frame(DOMAIN_ATLAS_COLS, domain_buf, int_cols=("domain_id", "action")),
+		summary=summary,
+	)
+
+
+def write_outputs(result: SimulationResult, out_dir: Path) -> None:
+	"""Write event_atlas.csv, domain_atlas.csv (plus sidecars) and summary.json."""
+	write_atlas(out_dir / "event_atlas.csv", result.event_atlas)
+	write_atlas(out_dir / "domain_atlas.csv", result.domain_atlas)
 	with open(out_dir / "summary.json", "w", encoding="utf-8") as f:
-		json.dump(summary, f, indent=2)
+		json.dump(result.summary, f, indent=2)
+
+	print(f"Wrote {len(result.event_atlas)} global atlas rows to {out_dir / 'event_atlas.csv'}", flush=True)
+	print(f"Wrote {len(result.domain_atlas)} domain atlas rows to {out_dir / 'domain_atlas.csv'}", flush=True)
+
 
-	print(f"Wrote {len(atlas_rows)} global atlas rows to {out_dir / 'event_atlas.csv'}", flush=True)
-	print(f"Wrote {len(domain_rows)} domain atlas rows to {out_dir / 'domain_atlas.csv'}", flush=True)
+def run_one(cfg: dict, out_dir: str | Path) -> dict:
+	"""Simulate one config, write its outputs to out_dir and return the summary."""
+	out_dir = ensure_out_dir(str(out_dir))
+	print(f"Starting run → out={out_dir}", flush=True)
+	result = simulate(cfg)
+	write_outputs(result, out_dir)
+	return result.summary
+
+
+def main():
+	args = parse_args()
+	run_one(load_config(args.config), args.out)
 
 
 if __name__ == "__main__":
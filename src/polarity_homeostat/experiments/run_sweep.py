@@ -0,0 +1,61 @@
+"""
+Seed sweep: run the same config for several seeds in parallel processes.
+
+Each run is independent (its own Tissue RNG seeded from cfg["seed"]) and
+writes to OUT/seed<s>/ exactly as `run.py` would; a sweep_summary.json
+collects the per-seed summaries.
+
+  python -m polarity_homeostat.experiments.run_sweep \\
+      --config configs/exp_baseline.yaml --out results/sweep --seeds 1 2 3 4
+"""
+
+import argparse
+import copy
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from .run import ensure_out_dir, load_config, run_one
+
+
+def parse_args():
+	parser = argparse.ArgumentParser()
+	parser.add_argument("--config", required=True, help="Path to YAML config")
+	parser.add_argument("--out", required=True, help="Output directory (one subdirectory per seed)")
+	parser.add_argument(
+		"--seeds", type=int, nargs="+", default=None,
+		help="Seeds to run (default: sweep.seeds from the config)",
+	)
+	parser.add_argument(
+		"--jobs", type=int, default=None,
+		help="Worker processes (default: one per CPU, at most one per seed)",
+	)
+	return parser.parse_args()
+
+
+def seed_configs(cfg: dict, seeds: list) -> list:
+	"""One independent copy of cfg per seed, with cfg["seed"] overridden."""
+	return [copy.deepcopy(cfg) | {"seed": int(s)} for s in seeds]
+
+
+def main():
+	args = parse_args()
+	cfg = load_config(args.config)
+	seeds = args.seeds if args.seeds is not None else cfg.get("sweep", {}).get("seeds")
+	if not seeds:
+		raise SystemExit("No seeds given (use --seeds or sweep.seeds in the config)")
+	out_dir = ensure_out_dir(args.out)
+
+	jobs = min(len(seeds), args.jobs or os.cpu_count() or 1)
+	out_dirs = [out_dir / f"seed{s}" for s in seeds]
+	with ProcessPoolExecutor(max_workers=jobs) as pool:
+		summaries = list(pool.map(run_one, seed_configs(cfg, seeds), out_dirs))
+
+	with open(out_dir / "sweep_summary.json", "w", encoding="utf-8") as f:
+		json.dump({str(s): summary for s, summary in zip(seeds, summaries)}, f, indent=2)
+	print(f"Wrote {len(seeds)} runs to {out_dir}", flush=True)
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,87 @@
+"""
+Numba kernels for the Tissue / Energy Euler steps.
+
+Each kernel streams its grid once, reading the current state and writing the
+next one into a second buffer (the caller swaps the two), instead of building
+the Laplacian and the leak/flux temporaries with NumPy. The arithmetic follows
+Tissue.step / Energy.step term for term, so both paths agree for float64 grids.
+Rows are independent, so large grids are split across threads.
+"""
+
+from ..utils.jit import njit, prange
+
+
+@njit(cache=True)
+def _neighbors(n, k, neumann):
+	"""Indices of k's lower and upper neighbors on an axis of length n."""
+	if neumann:
+		return max(k - 1, 0), min(k + 1, n - 1)
+	return (k - 1) if k > 0 else n - 1, (k + 1) if k < n - 1 else 0
+
+
+@njit(cache=True)
+def _lap_at(F, i, i_lo, i_hi, j, neumann):
+	"""5-point Laplacian of F at (i, j), periodic or zero-flux (edge-clamped)."""
+	j_lo, j_hi = _neighbors(F.shape[1], j, neumann)
+	# Same summation order as laplacian_2d / laplacian_2d_neumann
+	if neumann:
+		ud = F[i_lo, j] + F[i_hi, j]
+	else:
+		ud = F[i_hi, j] + F[i_lo, j]
+	return ud + F[i, j_lo] + F[i, j_hi] - 4.0 * F[i, j]
+
+
+@njit(cache=True)
+def _tissue_row(V, u_act, noise, has_noise, out, i, dt, gL, EL, D, neumann):
+	i_lo, i_hi = _neighbors(V.shape[0], i, neumann)
+	for j in range(V.shape[1]):
+		v = V[i, j]
+		rhs = (v - EL) * -gL + _lap_at(V, i, i_lo, i_hi, j, neumann) * D + u_act[i, j]
+		v = v + rhs * dt
+		if has_noise:
+			v = v + noise[i, j]
+		out[i, j] = v
+
+
+@njit(cache=True)
+def tissue_step(V, u_act, noise, has_noise, out, dt, gL, EL, D, neumann):
+	"""out = V + dt * (-gL*(V - EL) + D*lap(V) + u_act) [+ noise]."""
+	for i in range(V.shape[0]):
+		_tissue_row(V, u_act, noise, has_noise, out, i, dt, gL, EL, D, neumann)
+	return out
+
+
+@njit(parallel=True, cache=True)
+def tissue_step_parallel(V, u_act, noise, has_noise, out, dt, gL, EL, D, neumann):
+	"""`tissue_step` with rows split across threads."""
+	for i in prange(V.shape[0]):
+		_tissue_row(V, u_act, noise, has_noise, out, i, dt, gL, EL, D, neumann)
+	return out
+
+
+@njit(cache=True)
+def _energy_row(E, u_act, out, i, dt, k_oxphos, gamma, alpha, beta):
+	i_lo, i_hi = _neighbors(E.shape[0], i, False)
+	for j in range(E.shape[1]):
+		e = E[i, j]
+		flux = beta * _lap_at(E, i, i_lo, i_hi, j, False) if beta != 0.0 else 0.0
+		de = k_oxphos * (1.0 - e) - gamma * e - alpha * abs(u_act[i, j]) + flux
+		e = e + dt * de
+		# Clamp to non-negative range (NaN passes through, as with np.maximum)
+		out[i, j] = 0.0 if e < 0.0 else e
+
+
+@njit(cache=True)
+def energy_step(E, u_act, out, dt, k_oxphos, gamma, alpha, beta):
+	"""out = max(E + dt * (k(1-E) - gamma*E - alpha*|u_act| + beta*lap(E)), 0)."""
+	for i in range(E.shape[0]):
+		_energy_row(E, u_act, out, i, dt, k_oxphos, gamma, alpha, beta)
+	return out
+
+
+@njit(parallel=True, cache=True)
+def energy_step_parallel(E, u_act, out, dt, k_oxphos, gamma, alpha, beta):
+	"""`energy_step` with rows split across threads."""
+	for i in prange(E.shape[0]):
+		_energy_row(E, u_act, out, i, dt, k_oxphos, gamma, alpha, beta)
+	return out
@@ -4,7 +4,9 @@ from dataclasses import dataclass
 from typing import Tuple, Optional
 import numpy as np
 
+from ..utils.jit import HAVE_NUMBA, PARALLEL_MIN_CELLS
 from ..utils.math_utils import laplacian_2d
+from . import _kernels
 
 
 @dataclass
@@ -16,6 +18,7 @@ class EnergyConfig:
 	beta_tnt_flux: float
 	gamma_decay: float
 	Emin: float
+	dtype: str = "float64"  # grid precision
 
 
 class Energy:
@@ -27,24 +30,57 @@ class Energy:
 	def __init__(self, cfg: EnergyConfig):
 		self.cfg = cfg
 		self.h, self.w = cfg.grid
-		self.E = np.full((self.h, self.w), float(cfg.E0), dtype=float)
+		self.E = np.full((self.h, self.w), float(cfg.E0), dtype=np.dtype(cfg.dtype))
+		# Scratch buffers reused every step; _rhs doubles as the next-state
+		# buffer on the numba path
+		self._rhs = np.empty_like(self.E)
+		self._tmp = np.empty_like(self.E)
 
 	def set_initial(self, e0: float | np.ndarray) -> None:
 		if isinstance(e0, np.ndarray):
 			assert e0.shape == (self.h, self.w)
-			self.E = e0.astype(float, copy=True)
+			self.E[...] = e0
 		else:
 			self.E.fill(float(e0))
 
 	def step(self, dt: float, u_act: Optional[np.ndarray] = None, u_tnt_ev: float = 0.0) -> None:
+		"""
+		Advance E by one Euler step and clamp at 0. self.E is updated in place
+		on both paths, so a reference to it always holds the current state.
+		"""
 		E = self.E
-		lapE = laplacian_2d(E) if self.cfg.beta_tnt_flux != 0.0 else 0.0
-		cost = 0.0
+		if HAVE_NUMBA and isinstance(u_act, np.ndarray) and u_act.shape == E.shape:
+			self._step_fused(dt, u_act)
+			return
+		cfg = self.cfg
+		# prod - decay - cost + flux, accumulated in place (same order as the
+		# expression in the class docstring)
+		rhs = np.subtract(1.0, E, out=self._rhs)
+		rhs *= cfg.k_oxphos
+		rhs -= np.multiply(E, cfg.gamma_decay, out=self._tmp)
 		if u_act is not None:
-			cost = self.cfg.alpha_actuation_cost * np.abs(u_act)
-		prod = self.cfg.k_oxphos * (1.0 - E)
-		decay = self.cfg.gamma_decay * E
-		flux = self.cfg.beta_tnt_flux * lapE
-		self.E = E + dt * (prod - decay - cost + flux)
+			cost = np.abs(u_act, out=self._tmp)
+			cost *= cfg.alpha_actuation_cost
+			rhs -= cost
+		if cfg.beta_tnt_flux != 0.0:
+			flux = laplacian_2d(E, out=self._tmp)
+			flux *= cfg.beta_tnt_flux
+			rhs += flux
+		rhs *= dt
+		E += rhs
 		# Clamp to non-negative range
-		self.E = np.maximum(self.E, 0.0)
+		np.maximum(E, 0.0, out=E)
+
+	def _step_fused(self, dt: float, u_act: np.ndarray) -> None:
+		"""Same update as `step` in one kernel pass into the scratch buffer, copied back into E."""
+		cfg = self.cfg
+		kernel = (
+			_kernels.energy_step_parallel if self.h * self.w >= PARALLEL_MIN_CELLS
+			else _kernels.energy_step
+		)
+		out = self._rhs
+		kernel(
+			self.E, u_act, out, float(dt), float(cfg.k_oxphos), float(cfg.gamma_decay),
+			float(cfg.alpha_actuation_cost), float(cfg.beta_tnt_flux),
+		)
+		self.E[...] = out
@@ -4,7 +4,14 @@ from dataclasses import dataclass
 from typing import Tuple, Optional
 import numpy as np
 
+from ..utils.jit import HAVE_NUMBA, PARALLEL_MIN_CELLS
 from ..utils.math_utils import laplacian_2d, laplacian_2d_neumann
+from . import _kernels
+
+# Noise is drawn for up to this many steps at once, capped at this many values
+# per draw (8 MB of float64) so large grids do not pre-allocate much memory
+NOISE_CHUNK_STEPS = 256
+NOISE_CHUNK_MAX_VALUES = 1 << 20
 
 
 @dataclass
@@ -16,6 +23,7 @@ class TissueConfig:
 	coupling_D: float
 	noise_rms: float = 0.0
 	boundary: str = "periodic"
+	dtype: str = "float64"  # grid precision; "float32" halves memory traffic
 
 
 class Tissue:
@@ -27,29 +35,81 @@ class Tissue:
 		self.cfg = cfg
 		self.h, self.w = cfg.grid
 		self.dt = float(cfg.dt)
-		self.V = np.full((self.h, self.w), -18.0, dtype=float)  # default initial depolarized state
+		self.dtype = np.dtype(cfg.dtype)
+		self.V = np.full((self.h, self.w), -18.0, dtype=self.dtype)  # default initial depolarized state
+		# Boundary handling is fixed for the tissue's lifetime; resolve it once
+		self._neumann = (cfg.boundary or "periodic").lower() == "neumann"
+		self._lap_fn = laplacian_2d_neumann if self._neumann else laplacian_2d
 		self._rng = np.random.default_rng(int(seed) if seed is not None else None)
+		# Scratch RHS buffer (NumPy path) / next-state buffer (numba path),
+		# reused every step
+		self._rhs = np.empty((self.h, self.w), dtype=self.dtype)
+		self._lap_buf = np.empty((self.h, self.w), dtype=self.dtype)
+		# Pre-drawn noise for the next steps; one (h, w) slice is consumed per step
+		n_chunk = max(1, min(NOISE_CHUNK_STEPS, NOISE_CHUNK_MAX_VALUES // (self.h * self.w)))
+		self._noise = np.empty((n_chunk, self.h, self.w), dtype=self.dtype) if cfg.noise_rms > 0 else None
+		self._noise_pos = n_chunk
 
 	def set_initial(self, v0: float | np.ndarray) -> None:
 		if isinstance(v0, np.ndarray):
 			assert v0.shape == (self.h, self.w)
-			self.V = v0.astype(float, copy=True)
+			self.V[...] = v0
 		else:
 			self.V.fill(float(v0))
 
-	def _lap(self, V: np.ndarray) -> np.ndarray:
-		b = (self.cfg.boundary or "periodic").lower()
-		if b == "neumann":
-			return laplacian_2d_neumann(V)
-		return laplacian_2d(V)
+	def _lap(self, V: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+		return self._lap_fn(V, out=out)
 
 	def step(self, u_act: Optional[np.ndarray] = None) -> None:
+		"""
+		Advance V by one Euler step:
+		V += dt * (-gL*(V - EL) + D*lap(V) + u_act) + noise.
+		self.V is updated in place on both paths, so a reference to it always
+		holds the current state.
+		"""
 		V = self.V
-		lap = self._lap(V)
-		leak = -self.cfg.gL * (V - self.cfg.EL)
-		diff = self.cfg.coupling_D * lap
-		noise = self._rng.normal(0.0, self.cfg.noise_rms, size=V.shape) if self.cfg.noise_rms > 0 else 0.0
-		input_term = 0.0
+		if HAVE_NUMBA and isinstance(u_act, np.ndarray) and u_act.shape == V.shape:
+			self._step_fused(u_act)
+			return
+		lap = self._lap(V, out=self._lap_buf)
+		# Leak + diffusion + input, accumulated in the scratch buffer
+		rhs = np.subtract(V, self.cfg.EL, out=self._rhs)
+		rhs *= -self.cfg.gL
+		lap *= self.cfg.coupling_D
+		rhs += lap
 		if u_act is not None:
-			input_term = u_act
-		self.V = V + self.dt * (leak + diff + input_term) + noise
+			rhs += u_act
+		rhs *= self.dt
+		V += rhs
+		if self.cfg.noise_rms > 0:
+			V += self._next_noise()
+
+	def _step_fused(self, u_act: np.ndarray) -> None:
+		"""Same update as `step` in one kernel pass into the scratch buffer, copied back into V."""
+		cfg = self.cfg
+		has_noise = cfg.noise_rms > 0
+		noise = self._next_noise() if has_noise else self._rhs
+		kernel = (
+			_kernels.tissue_step_parallel if self.h * self.w >= PARALLEL_MIN_CELLS
+			else _kernels.tissue_step
+		)
+		out = self._rhs
+		kernel(
+			self.V, u_act, noise, has_noise, out, self.dt, float(cfg.gL), float(cfg.EL),
+			float(cfg.coupling_D), self._neumann,
+		)
+		self.V[...] = out
+
+	def _next_noise(self) -> np.ndarray:
+		"""
+		Noise for one step. Draws are made a chunk of steps at a time; the
+		Generator stream is sequential, so the values match per-step
+		rng.normal(0, noise_rms, size=(h, w)) calls exactly.
+		"""
+		if self._noise_pos == len(self._noise):
+			self._rng.standard_normal(out=self._noise, dtype=self.dtype)
+			self._noise *= self.cfg.noise_rms
+			self._noise_pos = 0
+		noise = self._noise[self._noise_pos]
+		self._noise_pos += 1
+		return noise
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Optional
 
+import numpy as np
+
 
 def energy_gate(E_mean: float, Emin_eff: float) -> bool:
 	"""Allow actuation only if energy is above the (possibly adaptive) minimum."""
@@ -23,17 +25,30 @@ def oscillation_gate(plv_bad: bool) -> bool:
 	return bool(plv_bad)
 
 
+def coupling_adequate(D_est: Optional[float], min_coupling: float) -> bool:
+	"""True if D_est is known and >= min_coupling, i.e. geometry consensus applies."""
+	if D_est is None:
+		return False
+	try:
+		Dval = float(D_est)
+	except Exception:
+		return False
+	return not Dval < float(min_coupling)
+
+
 def geometry_gate(mismatch_mean: float, max_mismatch: float, D_est: Optional[float], min_coupling: float) -> bool:
 	"""
 	Require consensus (low mismatch) when coupling is adequate. If coupling is poor
 	(D_est < min_coupling or D_est is None/blank), do not block on geometry.
 	"""
-	if D_est is None:
-		return True
-	try:
-		Dval = float(D_est)
-	except Exception:
-		return True
-	if Dval < float(min_coupling):
+	if not coupling_adequate(D_est, min_coupling):
 		return True
 	return float(mismatch_mean) <= float(max_mismatch)
+
+
+def geometry_gate_batch(mismatch_means: np.ndarray, max_mismatch: float, D_est: Optional[float], min_coupling: float) -> np.ndarray:
+	"""`geometry_gate` for an array of per-domain mismatch means sharing one D_est."""
+	mismatch_means = np.asarray(mismatch_means)
+	if not coupling_adequate(D_est, min_coupling):
+		return np.ones(mismatch_means.shape, dtype=bool)
+	return mismatch_means <= float(max_mismatch)
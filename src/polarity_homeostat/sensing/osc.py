@@ -3,7 +3,22 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Optional, Tuple
 import numpy as np
-from scipy.signal import hilbert, butter, filtfilt
+from scipy.signal import butter, filtfilt
+
+
+def analytic_signal(x: np.ndarray) -> np.ndarray:
+	"""
+	Analytic signal of a real 1D series, as scipy.signal.hilbert(x): the
+	one-sided spectrum (DC and Nyquist kept, positive bins doubled) is taken
+	with rfft, which computes only the non-negative half of the FFT.
+	"""
+	n = x.shape[0]
+	X = np.fft.rfft(x)
+	Z = np.zeros(n, dtype=X.dtype)
+	Z[:X.shape[0]] = X
+	# Bins 1..ceil(n/2)-1 are doubled; for even n the Nyquist bin is not
+	Z[1:(n + 1) // 2] *= 2.0
+	return np.fft.ifft(Z)
 
 
 @dataclass
@@ -38,6 +53,11 @@ class OscillationDetector:
 		self._acc_steps = 0
 		self._bad_seconds = 0.0
 		self._last_plv: Optional[float] = None
+		# PLV only changes when a downsampled sample lands; cache it until then
+		self._plv_cache: Optional[float] = None
+		self._plv_dirty = True
+		# Filter coefficients depend only on cfg.bandpass, dt and downsample
+		self._ba = self._design_bandpass()
 
 	def update(self, V: np.ndarray) -> None:
 		"""Downsample and append mean(V) to ring buffer."""
@@ -49,10 +69,37 @@ class OscillationDetector:
 		self._buf[self._buf_idx] = val
 		self._buf_idx = (self._buf_idx + 1) % self._buf_len
 		self._buf_count = min(self._buf_count + 1, self._buf_len)
+		self._plv_dirty = True
 
-	def _maybe_bandpass(self, x: np.ndarray) -> np.ndarray:
+	def update_batch(self, V_series: np.ndarray) -> None:
+		"""
+		Equivalent to calling `update` on each frame of a (T, H, W) series.
+		Only the frames that land on a downsample boundary are reduced, and
+		they are written to the ring buffer together.
+		"""
+		T = len(V_series)
+		if T == 0:
+			return
+		# Frame t completes a downsample period when acc + t + 1 is a multiple of ds
+		first = self._ds - self._acc_steps - 1
+		self._acc_steps = (self._acc_steps + T) % self._ds
+		frames = range(first, T, self._ds)
+		if not frames:
+			return
+		# Only the newest buf_len samples can survive in the ring
+		n = len(frames)
+		frames = frames[max(0, n - self._buf_len):]
+		vals = [float(np.mean(V_series[i])) for i in frames]
+		pos = (self._buf_idx + (n - len(vals)) + np.arange(len(vals))) % self._buf_len
+		self._buf[pos] = vals
+		self._buf_idx = (self._buf_idx + n) % self._buf_len
+		self._buf_count = min(self._buf_count + n, self._buf_len)
+		self._plv_dirty = True
+
+	def _design_bandpass(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+		"""Butterworth (b, a) for cfg.bandpass, or None if band-pass is off/degenerate."""
 		if not self.cfg.bandpass:
-			return x
+			return None
 		lo, hi = self.cfg.bandpass
 		fs = 1.0 / (self.dt * self._ds)
 		# Normalize to Nyquist
@@ -60,8 +107,13 @@ class OscillationDetector:
 		lo_n = max(1e-6, float(lo) / nyq)
 		hi_n = min(0.999, float(hi) / nyq)
 		if lo_n >= hi_n:
+			return None
+		return butter(N=2, Wn=[lo_n, hi_n], btype="band")
+
+	def _maybe_bandpass(self, x: np.ndarray) -> np.ndarray:
+		if self._ba is None:
 			return x
-		b, a = butter(N=2, Wn=[lo_n, hi_n], btype="band")
+		b, a = self._ba
 		try:
 			return filtfilt(b, a, x, method="pad")
 		except Exception:
@@ -81,9 +133,12 @@ class OscillationDetector:
 			return 0.0
 		# Optional light band-pass
 		x = self._maybe_bandpass(x)
-		z = hilbert(x)
-		phase = np.angle(z)
-		plv = float(np.abs(np.mean(np.exp(1j * phase))))
+		z = analytic_signal(x)
+		# Unit phasors exp(1j*angle(z)) taken directly as z/|z| (no arctan2/exp);
+		# z == 0 has angle 0, i.e. phasor 1
+		mag = np.abs(z)
+		unit = np.divide(z, mag, out=np.ones_like(z), where=mag > 0.0)
+		plv = float(np.abs(np.mean(unit)))
 		return max(0.0, min(1.0, plv))
 
 	def plv_with_persistence(self) -> Tuple[Optional[float], bool]:
@@ -92,7 +147,10 @@ class OscillationDetector:
 		is_persistently_bad is True only if PLV < healthy_plv_min for >= min_bad_duration_s.
 		If PLV is None (insufficient data), returns (None, False).
 		"""
-		plv = self._compute_plv()
+		if self._plv_dirty:
+			self._plv_cache = self._compute_plv()
+			self._plv_dirty = False
+		plv = self._plv_cache
 		self._last_plv = plv
 		if plv is None:
 			return None, False
@@ -5,9 +5,66 @@ from typing import Tuple
 
 import numpy as np
 
+from ..utils.jit import HAVE_NUMBA, PARALLEL_MIN_CELLS, njit, prange
 from ..utils.math_utils import ema_update
 
 
+@njit(cache=True)
+def _mismatch_row(low_state, i, out):
+    """Periodic 4-neighbor LOW-label mismatch for row i of the grid."""
+    h, w = low_state.shape
+    up = (i + 1) % h
+    down = (i + h - 1) % h
+    for j in range(w):
+        c = low_state[i, j]
+        # Fraction of neighbors whose label differs from the cell's
+        n_diff = (
+            int(low_state[up, j] != c)
+            + int(low_state[down, j] != c)
+            + int(low_state[i, (j + w - 1) % w] != c)
+            + int(low_state[i, (j + 1) % w] != c)
+        )
+        out[i, j] = n_diff * 0.25
+
+
+@njit(parallel=True, cache=True)
+def _neighbor_mismatch_kernel(low_state, out):
+    """Mismatch over the whole grid, one row per parallel iteration."""
+    for i in prange(low_state.shape[0]):
+        _mismatch_row(low_state, i, out)
+    return out
+
+
+@njit(cache=True)
+def _update_row(V, low_state, low_occ, i, low_enter, low_exit, alpha):
+    """Schmitt LOW update and occupancy EMA for row i, in place."""
+    for j in range(V.shape[1]):
+        v = V[i, j]
+        if v >= low_enter:
+            low_state[i, j] = True
+        elif v <= low_exit:
+            low_state[i, j] = False
+        ind = 1.0 if low_state[i, j] else 0.0
+        low_occ[i, j] = (1.0 - alpha) * low_occ[i, j] + alpha * ind
+
+
+@njit(cache=True)
+def _fused_update_kernel(V, low_state, low_occ, low_enter, low_exit, alpha, mismatch):
+    """
+    Band update, occupancy update and mismatch in a single row sweep: row i-1's
+    mismatch is computed as soon as row i is updated, so each V/state row is
+    touched while still in cache. Rows 0 and h-1 wait for the periodic wrap.
+    """
+    h = V.shape[0]
+    for i in range(h):
+        _update_row(V, low_state, low_occ, i, low_enter, low_exit, alpha)
+        if 2 <= i:
+            _mismatch_row(low_state, i - 1, mismatch)
+    _mismatch_row(low_state, 0, mismatch)
+    _mismatch_row(low_state, h - 1, mismatch)
+    return mismatch
+
+
 @dataclass
 class RecorderConfig:
     # LOW band is "pathologically depolarized" (more positive). We assume low_exit < low_enter.
@@ -24,20 +81,26 @@ class Recorder:
     global_v_offset (EMA of mean(V) relative to a healthy reference).
     """
 
-    def __init__(self, cfg: RecorderConfig, grid: Tuple[int, int], dt: float):
+    def __init__(self, cfg: RecorderConfig, grid: Tuple[int, int], dt: float, dtype=float):
         self.cfg = cfg
         self.h, self.w = grid
         self.dt = float(dt)
 
         # Schmitt LOW state (boolean grid)
         self.low_state = np.zeros((self.h, self.w), dtype=bool)
+        # Scratch mask for the in-place Schmitt update
+        self._band_mask = np.empty((self.h, self.w), dtype=bool)
 
         # Leaky LOW occupancy state (float grid)
-        self.low_occ = np.zeros((self.h, self.w), dtype=float)
+        self.low_occ = np.zeros((self.h, self.w), dtype=dtype)
         self._low_alpha = float(
             np.clip(self.dt / max(1e-6, self.cfg.tau_low), 1e-6, 1.0)
         )
 
+        # Output buffer for the mismatch grid (values are multiples of 1/4,
+        # exact in any float dtype), rewritten on every call
+        self._mismatch = np.empty((self.h, self.w), dtype=dtype)
+
         # EMA of global voltage offset
         self._ema_global_offset = 0.0
         self._healthy_ref: float | None = None
@@ -55,33 +118,86 @@ class Recorder:
         - Otherwise keep previous state.
         """
         assert V.shape == (self.h, self.w)
-        enter = V >= self.cfg.low_enter
-        exit_ = V <= self.cfg.low_exit
-        self.low_state = np.where(
-            enter,
-            True,
-            np.where(exit_, False, self.low_state),
-        )
+        # In place: state = (state & ~exit) | enter, so enter wins over exit
+        ls = self.low_state
+        mask = self._band_mask
+        np.less_equal(V, self.cfg.low_exit, out=mask)
+        np.logical_not(mask, out=mask)
+        ls &= mask
+        np.greater_equal(V, self.cfg.low_enter, out=mask)
+        ls |= mask
+
+    def update_bands_series(self, V_series: np.ndarray) -> np.ndarray:
+        """
+        Apply update_bands to each frame of a (T, h, w) series at once and
+        return the (T, h, w) LOW state after every frame; low_state is left at
+        the last one. Each cell's state at step t is set by its most recent
+        enter/exit crossing (enter wins when both hold), or carried over from
+        the current low_state if it has not crossed yet.
+        """
+        V_series = np.asarray(V_series)
+        assert V_series.shape[1:] == (self.h, self.w)
+        T = V_series.shape[0]
+        if T == 0:
+            return np.zeros((0, self.h, self.w), dtype=bool)
+        enter = V_series >= self.cfg.low_enter
+        crossed = enter | (V_series <= self.cfg.low_exit)
+        # 1-based index of the latest crossing up to each step (0 = none yet)
+        last = np.where(crossed, np.arange(1, T + 1).reshape(T, 1, 1), 0)
+        np.maximum.accumulate(last, axis=0, out=last)
+        states = np.take_along_axis(enter, np.maximum(last - 1, 0), axis=0)
+        states = np.where(last > 0, states, self.low_state)
+        self.low_state[...] = states[-1]
+        return states
 
     def update_low_occupancy(self) -> None:
         """Leaky integrate LOW occupancy indicator into low_occ (unitless)."""
-        indicator = self.low_state.astype(float)
-        self.low_occ = (1.0 - self._low_alpha) * self.low_occ + self._low_alpha * indicator
+        # In place: alpha * indicator is alpha on LOW cells and 0 elsewhere,
+        # so only LOW cells need the add
+        low_occ = self.low_occ
+        np.multiply(low_occ, 1.0 - self._low_alpha, out=low_occ)
+        np.add(low_occ, self._low_alpha, out=low_occ, where=self.low_state)
 
     def neighbor_mismatch(self, V: np.ndarray) -> np.ndarray:
         """
         Compute a simple neighbor mismatch metric on LOW-state labels.
         For each cell: fraction of 4-neighbors that differ from the cell's LOW label.
+        The returned grid is a recorder-owned buffer, overwritten by the next
+        neighbor_mismatch / update_all call.
         """
-        ls = self.low_state.astype(float)
-        up = np.roll(ls, -1, axis=0)
-        down = np.roll(ls, 1, axis=0)
-        left = np.roll(ls, 1, axis=1)
-        right = np.roll(ls, -1, axis=1)
-        neigh_mean = (up + down + left + right) / 4.0
-        # If cell is LOW, mismatch = 1 - neigh_mean; else mismatch = neigh_mean
-        mismatch = np.where(self.low_state, 1.0 - neigh_mean, neigh_mean)
-        return mismatch
+        if HAVE_NUMBA and self.h * self.w >= PARALLEL_MIN_CELLS:
+            return _neighbor_mismatch_kernel(self.low_state, self._mismatch)
+        # Count differing 4-neighbors with XOR on the 0/1 bytes of the bool
+        # grid (at most 4, so uint8 is enough); a LOW cell's mismatch is the
+        # fraction of non-LOW neighbors and vice versa
+        ls = self.low_state.view(np.uint8)
+        n_diff = np.roll(ls, -1, axis=0) ^ ls
+        n_diff += np.roll(ls, 1, axis=0) ^ ls
+        n_diff += np.roll(ls, 1, axis=1) ^ ls
+        n_diff += np.roll(ls, -1, axis=1) ^ ls
+        return np.multiply(n_diff, 0.25, out=self._mismatch)
+
+    def update_all(self, V: np.ndarray) -> np.ndarray:
+        """
+        update_bands(V), update_low_occupancy() and neighbor_mismatch(V) in one
+        call; returns the mismatch grid (the same buffer neighbor_mismatch
+        returns). With numba this is one fused sweep that updates low_state /
+        low_occ in place.
+        """
+        if not HAVE_NUMBA:
+            self.update_bands(V)
+            self.update_low_occupancy()
+            return self.neighbor_mismatch(V)
+        assert V.shape == (self.h, self.w)
+        return _fused_update_kernel(
+            V,
+            self.low_state,
+            self.low_occ,
+            float(self.cfg.low_enter),
+            float(self.cfg.low_exit),
+            self._low_alpha,
+            self._mismatch,
+        )
 
     def domain_low_fraction(self) -> float:
         """Fraction of cells currently in LOW band."""
@@ -90,14 +206,17 @@ class Recorder:
     def set_healthy_ref(self, v_ref: float) -> None:
         self._healthy_ref = float(v_ref)
 
-    def global_v_offset(self, V: np.ndarray) -> float:
+    def global_v_offset(self, V: np.ndarray, mean_V: float | None = None) -> float:
         """
         EMA of mean(V) - healthy_ref, using a slow time-constant.
         If healthy_ref not set, default to the current mean(V) on first call.
+        Pass `mean_V` if the caller has already reduced V this step.
         """
+        if mean_V is None:
+            mean_V = float(np.mean(V))
         if self._healthy_ref is None:
-            self._healthy_ref = float(np.mean(V))
-        delta = float(np.mean(V) - self._healthy_ref)
+            self._healthy_ref = mean_V
+        delta = float(mean_V - self._healthy_ref)
         self._ema_global_offset = ema_update(self._ema_global_offset, delta, self._ema_alpha)
         return self._ema_global_offset
 
@@ -1,6 +1,9 @@
-from .math_utils import ema_update, estimate_coupling_shortlag
+from .math_utils import domain_means, ema_update, estimate_coupling_shortlag, step_reductions, tile_means
 
 __all__ = [
+	"domain_means",
 	"ema_update",
 	"estimate_coupling_shortlag",
+	"step_reductions",
+	"tile_means",
 ]
@@ -0,0 +1,25 @@
+"""
+Optional Numba support.
+
+numba is not a hard dependency: when it is missing, `njit` is a no-op
+decorator and `prange` is `range`, so decorated kernels still import (and run
+as plain Python). Callers with a vectorized NumPy path should check
+HAVE_NUMBA and only dispatch to the kernel when it is compiled.
+"""
+
+# Grids at least this large use the parallel (prange) variant of a kernel;
+# below it, thread start-up costs more than the work.
+PARALLEL_MIN_CELLS = 128 * 128
+
+try:
+	from numba import njit, prange
+	HAVE_NUMBA = True
+except ImportError:
+	HAVE_NUMBA = False
+	prange = range
+
+	def njit(*args, **kwargs):
+		"""Stand-in for numba.njit: returns the function unchanged."""
+		if len(args) == 1 and callable(args[0]) and not kwargs:
+			return args[0]
+		return lambda fn: fn
@@ -1,53 +1,236 @@
 import numpy as np
-from typing import Tuple
+from typing import Optional, Tuple
 
+from .jit import HAVE_NUMBA, PARALLEL_MIN_CELLS, njit, prange
 
-def laplacian_2d(field: np.ndarray) -> np.ndarray:
-	up    = np.roll(field, -1, axis=0)
-	down  = np.roll(field, 1, axis=0)
-	left  = np.roll(field, 1, axis=1)
-	right = np.roll(field, -1, axis=1)
-	return up + down + left + right - 4.0 * field
 
+def laplacian_2d(field: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+	"""
+	Periodic 5-point Laplacian up + down + left + right - 4*center. The shifted
+	neighbors are accumulated into `out` (allocated if None) by slicing rather
+	than np.roll copies; summation order is unchanged.
+	"""
+	f = field
+	out = np.empty_like(f) if out is None else out
+	# up: f[i+1], wrapping
+	out[:-1] = f[1:]
+	out[-1] = f[0]
+	# down: f[i-1]
+	out[1:] += f[:-1]
+	out[0] += f[-1]
+	# left: f[:, j-1]
+	out[:, 1:] += f[:, :-1]
+	out[:, 0] += f[:, -1]
+	# right: f[:, j+1]
+	out[:, :-1] += f[:, 1:]
+	out[:, -1] += f[:, 0]
+	out -= 4.0 * f
+	return out
 
-def laplacian_2d_neumann(field: np.ndarray) -> np.ndarray:
-	"""5-point Laplacian with Neumann (zero-flux) boundaries via edge replication."""
-	# Pad with edge values, then apply interior stencil and slice back
-	p = np.pad(field, pad_width=1, mode="edge")
-	up    = p[:-2, 1:-1]
-	down  = p[2:,  1:-1]
-	left  = p[1:-1, :-2]
-	right = p[1:-1, 2:]
-	center = p[1:-1, 1:-1]
-	return up + down + left + right - 4.0 * center
+
+def laplacian_2d_neumann(field: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+	"""5-point Laplacian with Neumann (zero-flux) boundaries, i.e. edge-replicated neighbors."""
+	f = field
+	out = np.empty_like(f) if out is None else out
+	# up: f[i-1], clamped
+	out[1:] = f[:-1]
+	out[0] = f[0]
+	# down: f[i+1]
+	out[:-1] += f[1:]
+	out[-1] += f[-1]
+	# left: f[:, j-1]
+	out[:, 1:] += f[:, :-1]
+	out[:, 0] += f[:, 0]
+	# right: f[:, j+1]
+	out[:, :-1] += f[:, 1:]
+	out[:, -1] += f[:, -1]
+	out -= 4.0 * f
+	return out
 
 
 # --- NEW: simple EMA + coupling estimator ---
 
+# Cells per block of frames in estimate_coupling_shortlag (~512 KB of float64)
+COUPLING_BLOCK_CELLS = 1 << 16
+
+
 def ema_update(prev: float, x: float, alpha: float) -> float:
 	"""Exponential moving average. alpha in (0,1]; higher = faster."""
 	alpha = float(np.clip(alpha, 1e-6, 1.0))
 	return (1.0 - alpha) * prev + alpha * x
 
 
-def estimate_coupling_shortlag(V_window: np.ndarray) -> float:
+def _shortlag_corrs(frames: np.ndarray) -> np.ndarray:
+	"""Per-frame correlation of V with its 4-neighbor mean, for a [t, H, W] stack."""
+	neigh_mean = np.roll(frames, -1, axis=1)
+	neigh_mean += np.roll(frames, 1, axis=1)
+	neigh_mean += np.roll(frames, 1, axis=2)
+	neigh_mean += np.roll(frames, -1, axis=2)
+	neigh_mean /= 4.0
+	a = frames - frames.mean(axis=(1, 2), keepdims=True)
+	b = neigh_mean - neigh_mean.mean(axis=(1, 2), keepdims=True)
+	num = np.einsum("thw,thw->t", a, b)
+	denom = np.sqrt(np.einsum("thw,thw->t", a, a)) * np.sqrt(np.einsum("thw,thw->t", b, b)) + 1e-9
+	return num / denom
+
+
+def estimate_coupling_shortlag(V_window: np.ndarray, start: int = 0) -> float:
 	"""
 	Rough 'coupling' proxy using short-lag spatial correlation of V across the grid,
 	averaged over time. V_window shape: [T, H, W]. Returns 0..1-ish.
+	If V_window is a ring buffer, `start` is the index of its oldest frame.
 	"""
 	if not isinstance(V_window, np.ndarray) or V_window.ndim != 3 or V_window.shape[0] < 4:
 		return 0.0
-	T = min(50, V_window.shape[0])
-	Vt = V_window[-T:]
-	corrs = []
-	for frame in Vt:
-		up    = np.roll(frame, -1, axis=0)
-		down  = np.roll(frame, 1, axis=0)
-		left  = np.roll(frame, 1, axis=1)
-		right = np.roll(frame, -1, axis=1)
-		neigh_mean = (up + down + left + right) / 4.0
-		a = frame.flatten() - frame.mean()
-		b = neigh_mean.flatten() - neigh_mean.mean()
-		denom = (np.linalg.norm(a) * np.linalg.norm(b) + 1e-9)
-		corrs.append(float((a @ b) / denom))
+	n = V_window.shape[0]
+	T = min(50, n)
+	# Ring indices of the newest T frames, oldest first
+	order = (start + np.arange(n - T, n)) % n
+	corrs = np.empty(T)
+	# Frames are processed in blocks so the temporaries stay cache-sized; a
+	# full buffer is read in storage order and the results reordered after
+	block = max(1, COUPLING_BLOCK_CELLS // (V_window.shape[1] * V_window.shape[2]))
+	for t0 in range(0, T, block):
+		if T == n:
+			frames = V_window[t0:t0 + block]
+		else:
+			frames = V_window[order[t0:t0 + block]]
+		corrs[t0:t0 + block] = _shortlag_corrs(frames)
+	if T == n:
+		corrs = corrs[order]
 	return float(np.clip((np.mean(corrs) + 1.0) / 2.0, 0.0, 1.0))
+
+
+@njit(cache=True, fastmath=True)
+def _step_reductions_kernel(V, low_occ, E, mismatch, low_state, Emin):
+	n = V.size
+	sum_V = 0.0
+	sum_low_occ = 0.0
+	sum_E = 0.0
+	sum_mismatch = 0.0
+	n_lowE = 0
+	n_low = 0
+	for idx in range(n):
+		sum_V += V[idx]
+		sum_low_occ += low_occ[idx]
+		e = E[idx]
+		sum_E += e
+		sum_mismatch += mismatch[idx]
+		if e < Emin:
+			n_lowE += 1
+		if low_state[idx]:
+			n_low += 1
+	return (
+		sum_V / n,
+		sum_low_occ / n,
+		sum_E / n,
+		sum_mismatch / n,
+		n_lowE / n,
+		n_low / n,
+	)
+
+
+def step_reductions(
+	V: np.ndarray,
+	low_occ: np.ndarray,
+	E: np.ndarray,
+	mismatch: np.ndarray,
+	low_state: np.ndarray,
+	Emin: float,
+) -> Tuple[float, float, float, float, float, float]:
+	"""
+	Per-step global reductions over equally shaped grids:
+	(mean V, mean low_occ, mean E, mean mismatch, fraction E < Emin, fraction LOW).
+	One fused pass when numba is available, separate NumPy reductions otherwise;
+	either way sums accumulate in float64, also for float32 grids.
+	"""
+	if HAVE_NUMBA:
+		# ravel() is a view for the contiguous state grids (a copy otherwise)
+		return _step_reductions_kernel(
+			V.ravel(), low_occ.ravel(), E.ravel(), mismatch.ravel(), low_state.ravel(), float(Emin)
+		)
+	return (
+		float(V.mean(dtype=np.float64)),
+		float(low_occ.mean(dtype=np.float64)),
+		float(E.mean(dtype=np.float64)),
+		float(mismatch.mean(dtype=np.float64)),
+		float(np.mean(E < Emin)),
+		float(np.mean(low_state)),
+	)
+
+
+def tile_means(A: np.ndarray, tile_h: int, tile_w: int) -> np.ndarray:
+	"""
+	Means of the (tile_h, tile_w) tiles of a 2D grid, flattened row-major
+	(tile (di, dj) at index di * n_tiles_w + dj). Grid dims must be multiples
+	of the tile dims. Accumulates in float64; bool grids give fractions.
+	"""
+	h, w = A.shape
+	tiles = A.reshape(h // tile_h, tile_h, w // tile_w, tile_w)
+	return tiles.mean(axis=(1, 3), dtype=np.float64).ravel()
+
+
+@njit(cache=True)
+def _domain_sums_row(low_occ, mismatch, low_state, E, di, tile_h, tile_w, out):
+	"""Sums over each tile of tile row di, stored in out[:, tile index]."""
+	n_dom_w = low_occ.shape[1] // tile_w
+	for dj in range(n_dom_w):
+		s_occ = 0.0
+		s_mm = 0.0
+		n_low = 0
+		s_E = 0.0
+		for i in range(di * tile_h, (di + 1) * tile_h):
+			for j in range(dj * tile_w, (dj + 1) * tile_w):
+				s_occ += low_occ[i, j]
+				s_mm += mismatch[i, j]
+				n_low += low_state[i, j]
+				s_E += E[i, j]
+		k = di * n_dom_w + dj
+		out[0, k] = s_occ
+		out[1, k] = s_mm
+		out[2, k] = n_low
+		out[3, k] = s_E
+
+
+@njit(cache=True)
+def _domain_means_kernel(low_occ, mismatch, low_state, E, tile_h, tile_w, out):
+	for di in range(low_occ.shape[0] // tile_h):
+		_domain_sums_row(low_occ, mismatch, low_state, E, di, tile_h, tile_w, out)
+	out /= tile_h * tile_w
+	return out
+
+
+@njit(parallel=True, cache=True)
+def _domain_means_kernel_parallel(low_occ, mismatch, low_state, E, tile_h, tile_w, out):
+	# Tile rows write disjoint columns of out
+	for di in prange(low_occ.shape[0] // tile_h):
+		_domain_sums_row(low_occ, mismatch, low_state, E, di, tile_h, tile_w, out)
+	out /= tile_h * tile_w
+	return out
+
+
+def domain_means(
+	low_occ: np.ndarray,
+	mismatch: np.ndarray,
+	low_state: np.ndarray,
+	E: np.ndarray,
+	tile_h: int,
+	tile_w: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+	"""
+	Per-domain (low_occ mean, mismatch mean, LOW fraction, E mean), each as
+	tile_means would return it. With numba all four come from one pass over
+	the grids, split across threads by tile row on large grids.
+	"""
+	if not HAVE_NUMBA:
+		return (
+			tile_means(low_occ, tile_h, tile_w),
+			tile_means(mismatch, tile_h, tile_w),
+			tile_means(low_state, tile_h, tile_w),
+			tile_means(E, tile_h, tile_w),
+		)
+	h, w = low_occ.shape
+	out = np.empty((4, (h // tile_h) * (w // tile_w)))
+	kernel = _domain_means_kernel_parallel if h * w >= PARALLEL_MIN_CELLS else _domain_means_kernel
+	kernel(low_occ, mismatch, low_state, E, int(tile_h), int(tile_w), out)
+	return out[0], out[1], out[2], out[3]
@@ -0,0 +1,28 @@
+import numpy as np
+from polarity_homeostat.utils import math_utils
+from polarity_homeostat.utils.math_utils import estimate_coupling_shortlag
+
+
+def _reference(frames):
+	corrs = []
+	for frame in frames:
+		neigh = (
+			np.roll(frame, -1, axis=0) + np.roll(frame, 1, axis=0)
+			+ np.roll(frame, 1, axis=1) + np.roll(frame, -1, axis=1)
+		) / 4.0
+		a = frame.ravel() - frame.mean()
+		b = neigh.ravel() - neigh.mean()
+		corrs.append((a @ b) / (np.linalg.norm(a) * np.linalg.norm(b) + 1e-9))
+	return float(np.clip((np.mean(corrs) + 1.0) / 2.0, 0.0, 1.0))
+
+
+def test_coupling_ring_buffer_matches_per_frame(monkeypatch):
+	# Small blocks so several are needed per call
+	monkeypatch.setattr(math_utils, "COUPLING_BLOCK_CELLS", 3 * 6 * 5)
+	rng = np.random.default_rng(0)
+	W = rng.normal(-20.0, 5.0, size=(60, 6, 5))
+	W[:, :3] += np.linspace(0.0, 4.0, 60)[:, None, None]
+	for n, start in ((60, 0), (60, 17), (30, 11)):
+		ring = W[:n]
+		ordered = np.roll(ring, -start, axis=0)[-50:]
+		assert np.isclose(estimate_coupling_shortlag(ring, start), _reference(ordered), rtol=1e-12, atol=0.0)
@@ -1,4 +1,5 @@
-from polarity_homeostat.decoder.rules import RulesDecoder, RulesThresholds, DecoderStability
+import numpy as np
+from polarity_homeostat.decoder.rules import BatchRulesDecoder, RulesDecoder, RulesThresholds, DecoderStability
 
 
 def test_decoder_dwell_and_hysteresis():
@@ -23,3 +24,42 @@ def test_decoder_dwell_and_hysteresis():
 	# After dwell expires, REST allowed again
 	a_after = dec.decide(low_occ=0.0, mismatch=1.0, E=1.0, plv=1.0, global_v_offset_mV=0.0, domain_low_fraction=0.0)
 	assert a_after == 0
+
+
+def test_scores_count_numpy_scalar_conditions():
+	f = np.float64
+	th = RulesThresholds(low_occ_threshold=f(0.3), energy_ok=f(0.35), mismatch_ok=f(0.3), healthy_plv_min=f(0.5))
+	dec = RulesDecoder(thresholds=th, stability=DecoderStability())
+	# All three REST conditions hold; plv and thresholds are NumPy scalars
+	rest, repair, _ = dec._scores(f(0.1), f(0.5), f(0.5), f(0.9), f(0.0), f(0.0), False)
+	assert rest == 1.0
+	assert repair == 0.2
+	rest, repair, _ = dec._scores(f(0.9), f(0.1), f(0.9), f(0.1), f(20.0), f(0.0), False)
+	assert rest == 0.0
+	assert repair == 1.0
+
+
+def test_batch_decoder_matches_per_domain_decoders():
+	th = RulesThresholds(prune_enabled=True, prune_low_occ_threshold=0.6, prune_energy_max=0.5, prune_mismatch_min=0.4, prune_dwell_steps=3)
+	st = DecoderStability(hysteresis_margin=0.1, decision_dwell=4)
+	n = 6
+	rng = np.random.default_rng(0)
+	active = np.array([True, True, False, True, True, True])
+	batch = BatchRulesDecoder(thresholds=th, stability=st, n=n)
+	decs = [RulesDecoder(thresholds=th, stability=st) for _ in range(n)]
+	seen = set()
+	for step in range(300):
+		low_occ, mismatch, E, low_frac = rng.random((4, n))
+		if 100 <= step < 140:
+			# Sustained prune evidence in domain 0
+			low_occ[0], mismatch[0], E[0] = 0.9, 0.8, 0.1
+		plv = None if step % 7 == 0 else float(rng.random())
+		gvo = float(rng.normal(8.0, 4.0))
+		actions = batch.decide(low_occ, mismatch, E, plv, gvo, low_frac, active=active)
+		expected = [
+			decs[k].decide(low_occ[k], mismatch[k], E[k], plv, gvo, low_frac[k]) if active[k] else 0
+			for k in range(n)
+		]
+		assert actions.tolist() == expected
+		seen.update(expected)
+	assert seen == {0, 1, 2}
@@ -1,4 +1,4 @@
-from polarity_homeostat.safety.gates import geometry_gate
+from polarity_homeostat.safety.gates import geometry_gate, geometry_gate_batch
 
 
 def test_geometry_gate_respects_coupling():
@@ -11,3 +11,10 @@ def test_geometry_gate_respects_coupling():
 	assert geometry_gate(mismatch_mean, max_mismatch, D_est=0.05, min_coupling=min_coupling) is True
 	# Unknown D_est: do not block on geometry (allow)
 	assert geometry_gate(mismatch_mean, max_mismatch, D_est=None, min_coupling=min_coupling) is True
+
+
+def test_geometry_gate_batch_matches_scalar():
+	mm = [0.1, 0.3, 0.6]
+	for D_est in (0.9, 0.05, None):
+		got = geometry_gate_batch(mm, 0.3, D_est, 0.1)
+		assert got.tolist() == [geometry_gate(m, 0.3, D_est, 0.1) for m in mm]
@@ -1,5 +1,6 @@
 import numpy as np
-from polarity_homeostat.sensing.osc import OscillationDetector, OscConfig
+from scipy.signal import hilbert
+from polarity_homeostat.sensing.osc import OscillationDetector, OscConfig, analytic_signal
 
 
 def test_plv_bounds_with_and_without_bandpass():
@@ -8,17 +9,44 @@ def test_plv_bounds_with_and_without_bandpass():
 	# Build a sine wave in mean(V)
 	t = np.arange(0, 50, dt)
 	sig = np.sin(2*np.pi*0.02*t)  # 0.02 Hz
+	V = np.empty(grid)
 	# Detector without band-pass
 	osc1 = OscillationDetector(OscConfig(window_seconds=10.0, healthy_plv_min=0.5, downsample=1), grid=grid, dt=dt)
 	for v in sig:
-		osc1.update(np.array([[v]], dtype=float))
+		V[0,0] = v
+		osc1.update(V)
 		plv, _ = osc1.plv_with_persistence()
 	if plv is not None:
 		assert 0.0 <= plv <= 1.0
 	# Detector with band-pass around the sine
 	osc2 = OscillationDetector(OscConfig(window_seconds=10.0, healthy_plv_min=0.5, downsample=1, bandpass=(0.005,0.05)), grid=grid, dt=dt)
 	for v in sig:
-		osc2.update(np.array([[v]], dtype=float))
+		V[0,0] = v
+		osc2.update(V)
 		plv2, _ = osc2.plv_with_persistence()
 	if plv2 is not None:
 		assert 0.0 <= plv2 <= 1.0
+
+
+def test_analytic_signal_matches_scipy_hilbert():
+	rng = np.random.default_rng(0)
+	for n in (8, 9, 64, 101):
+		x = rng.normal(size=n)
+		assert np.allclose(analytic_signal(x), hilbert(x), rtol=0.0, atol=1e-12)
+
+
+def test_update_batch_matches_per_step_updates():
+	rng = np.random.default_rng(1)
+	cfg = OscConfig(window_seconds=3.0, downsample=3)
+	ref = OscillationDetector(cfg, grid=(2, 2), dt=0.1)
+	osc = OscillationDetector(cfg, grid=(2, 2), dt=0.1)
+	# Uneven batches, including ones shorter than a downsample period and
+	# one longer than the whole ring
+	for T in (2, 1, 7, 0, 95, 4):
+		V = rng.normal(size=(T, 2, 2))
+		for frame in V:
+			ref.update(frame)
+		osc.update_batch(V)
+		assert np.array_equal(osc._buf, ref._buf)
+		assert (osc._buf_idx, osc._buf_count, osc._acc_steps) == (ref._buf_idx, ref._buf_count, ref._acc_steps)
+		assert osc.plv_with_persistence() == ref.plv_with_persistence()
@@ -1,3 +1,4 @@
+import numpy as np
 from polarity_homeostat.decoder.rules import RulesDecoder, RulesThresholds, DecoderStability
 
 
@@ -9,8 +10,7 @@ def test_prune_strict_demo():
 	st = DecoderStability(hysteresis_margin=0.05, decision_dwell=1)
 	dec = RulesDecoder(thresholds=th, stability=st)
 	# Feed frames that meet prune conditions long enough
-	acts = []
-	for _ in range(6):
-		a = dec.decide(low_occ=0.95, mismatch=0.8, E=0.1, plv=0.1, global_v_offset_mV=0.0, domain_low_fraction=0.9)
-		acts.append(a)
+	acts = np.empty(6, dtype=np.int8)
+	for i in range(acts.size):
+		acts[i] = dec.decide(low_occ=0.95, mismatch=0.8, E=0.1, plv=0.1, global_v_offset_mV=0.0, domain_low_fraction=0.9)
 	assert acts[-1] == 2
@@ -1,18 +1,40 @@
 import numpy as np
+import pytest
 from polarity_homeostat.sensing.recorder import Recorder, RecorderConfig
 
 
-def test_low_hysteresis_enter_exit():
-	rcfg = RecorderConfig(low_enter=-12.0, low_exit=-18.0, tau_low=10.0)
+@pytest.mark.parametrize(
+	"low_enter,low_exit,mid,hi,lo",
+	[(-12.0, -18.0, -15.0, -10.0, -20.0), (-20.0, -30.0, -25.0, -18.0, -32.0)],
+)
+def test_low_hysteresis_enter_exit(low_enter, low_exit, mid, hi, lo):
+	rcfg = RecorderConfig(low_enter=low_enter, low_exit=low_exit, tau_low=10.0)
 	rec = Recorder(rcfg, grid=(1,1), dt=1.0)
-	V = np.array([[-15.0]])  # between enter and exit → should not enter yet
+	V = np.array([[mid]])  # between enter and exit → should not enter yet
 	rec.update_bands(V)
 	assert bool(rec.low_state[0,0]) is False
 	# Cross enter threshold (more depolarized)
-	V[...] = -10.0
+	V[...] = hi
+	rec.update_bands(V)
+	assert bool(rec.low_state[0,0]) is True
+	# Back between the thresholds: hysteresis keeps LOW
+	V[...] = mid
 	rec.update_bands(V)
 	assert bool(rec.low_state[0,0]) is True
 	# Come back below exit threshold (more hyperpolarized) to clear LOW
-	V[...] = -20.0
+	V[...] = lo
 	rec.update_bands(V)
 	assert bool(rec.low_state[0,0]) is False
+
+def test_update_bands_series_matches_per_step():
+	rcfg = RecorderConfig(low_enter=-12.0, low_exit=-18.0, tau_low=10.0)
+	rec = Recorder(rcfg, grid=(4,5), dt=1.0)
+	ref = Recorder(rcfg, grid=(4,5), dt=1.0)
+	rng = np.random.default_rng(0)
+	for T in (30, 1, 17):
+		V = rng.uniform(-22.0, -8.0, size=(T, 4, 5))
+		states = rec.update_bands_series(V)
+		for t in range(T):
+			ref.update_bands(V[t])
+			assert np.array_equal(states[t], ref.low_state)
+		assert np.array_equal(rec.low_state, ref.low_state)
@@ -0,0 +1,32 @@
+import numpy as np
+from polarity_homeostat.sensing.recorder import Recorder, RecorderConfig, PARALLEL_MIN_CELLS
+
+
+def _reference_mismatch(ls):
+	f = ls.astype(float)
+	neigh = (np.roll(f, -1, 0) + np.roll(f, 1, 0) + np.roll(f, 1, 1) + np.roll(f, -1, 1)) / 4.0
+	return np.where(ls, 1.0 - neigh, neigh)
+
+
+def test_neighbor_mismatch_small_and_parallel_grids():
+	rng = np.random.default_rng(3)
+	side = int(np.ceil(np.sqrt(PARALLEL_MIN_CELLS)))
+	for grid in [(5, 7), (side, side + 3)]:
+		rec = Recorder(RecorderConfig(), grid=grid, dt=1.0)
+		rec.low_state = rng.random(grid) > 0.5
+		assert np.array_equal(rec.neighbor_mismatch(np.zeros(grid)), _reference_mismatch(rec.low_state))
+
+
+def test_update_all_matches_separate_updates():
+	rng = np.random.default_rng(5)
+	for grid in [(1, 4), (2, 3), (6, 5)]:
+		fused = Recorder(RecorderConfig(tau_low=5.0), grid=grid, dt=1.0)
+		ref = Recorder(RecorderConfig(tau_low=5.0), grid=grid, dt=1.0)
+		for _ in range(20):
+			V = rng.uniform(-25.0, -5.0, size=grid)
+			mismatch = fused.update_all(V)
+			ref.update_bands(V)
+			ref.update_low_occupancy()
+			assert np.array_equal(mismatch, ref.neighbor_mismatch(V))
+			assert np.array_equal(fused.low_state, ref.low_state)
+			assert np.array_equal(fused.low_occ, ref.low_occ)
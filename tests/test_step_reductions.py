@@ -0,0 +1,37 @@
+import numpy as np
+from polarity_homeostat.utils.math_utils import domain_means, step_reductions, tile_means
+
+
+def test_step_reductions_match_numpy():
+	rng = np.random.default_rng(0)
+	shape = (16, 12)
+	V = rng.normal(-40.0, 15.0, size=shape)
+	low_occ = rng.random(shape)
+	E = rng.random(shape)
+	mismatch = rng.random(shape)
+	low_state = rng.random(shape) > 0.6
+	out = step_reductions(V, low_occ, E, mismatch, low_state, 0.3)
+	expected = (
+		V.mean(), low_occ.mean(), E.mean(), mismatch.mean(),
+		np.mean(E < 0.3), np.mean(low_state),
+	)
+	assert np.allclose(out, expected, rtol=1e-12, atol=0.0)
+
+
+def test_tile_means_match_slices():
+	rng = np.random.default_rng(1)
+	A = rng.random((12, 10))
+	mask = A > 0.5
+	expected = [A[i:i + 4, j:j + 5].mean() for i in range(0, 12, 4) for j in range(0, 10, 5)]
+	assert np.allclose(tile_means(A, 4, 5), expected, rtol=1e-12, atol=0.0)
+	expected_frac = [mask[i:i + 4, j:j + 5].mean() for i in range(0, 12, 4) for j in range(0, 10, 5)]
+	assert np.array_equal(tile_means(mask, 4, 5), expected_frac)
+
+
+def test_domain_means_match_tile_means():
+	rng = np.random.default_rng(2)
+	low_occ, mismatch, E = rng.random((3, 12, 10))
+	low_state = rng.random((12, 10)) > 0.4
+	got = domain_means(low_occ, mismatch, low_state, E, 4, 5)
+	for grid, means in zip((low_occ, mismatch, low_state, E), got):
+		assert np.allclose(means, tile_means(grid, 4, 5), rtol=1e-12, atol=0.0)
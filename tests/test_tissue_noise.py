@@ -0,0 +1,11 @@
+import numpy as np
+from polarity_homeostat.model.tissue import Tissue, TissueConfig, NOISE_CHUNK_STEPS
+
+
+def test_chunked_noise_matches_per_step_draws():
+	cfg = TissueConfig(grid=(4, 3), dt=0.1, EL=-60.0, gL=0.05, coupling_D=0.2, noise_rms=0.7)
+	tissue = Tissue(cfg, seed=7)
+	rng = np.random.default_rng(7)
+	# Cross a chunk boundary
+	for _ in range(NOISE_CHUNK_STEPS + 5):
+		assert np.array_equal(tissue._next_noise(), rng.normal(0.0, 0.7, size=(4, 3)))